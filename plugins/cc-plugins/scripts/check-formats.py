@@ -67,6 +67,24 @@ class FormatChecker:
 
         return len(self.errors) == 0
 
+    def check_file(self, file_path: Path) -> List[Dict]:
+        """
+        Check a single markdown or JSON file, wherever it is located.
+
+        Args:
+            file_path: File to check; .json files are checked as JSON,
+                anything else as markdown
+
+        Returns:
+            Errors found in this file (they are also added to self.errors)
+        """
+        start = len(self.errors)
+        if file_path.suffix == '.json':
+            self._check_json_file(file_path)
+        else:
+            self._check_markdown_file(file_path)
+        return self.errors[start:]
+
     def _check_markdown_files(self):
         """Check all markdown files in the plugin."""
         # Check commands
@@ -7,19 +7,25 @@ official specifications.
 
 Usage:
     ./scripts/validate-plugin.py [path]
+    ./scripts/validate-plugin.py path path...
+
+With more than one path, every plugin is validated in this one run and the
+results are printed as a JSON array of {path, returncode, errors, warnings}.
 
 Exit codes:
-    0: Plugin is valid
+    0: Plugin is valid (all plugins, when several are given)
     1: Plugin has validation errors
     2: Script execution error
 
 Reference: https://code.claude.com/docs/en/plugin-development
 """
 
+import io
 import json
 import sys
+import contextlib
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -266,34 +272,117 @@ class PluginValidator:
                 print(f"\n{i}. {warning}")
 
 
-def main():
-    """Main entry point."""
-    # Get plugin directory
-    if len(sys.argv) > 1:
-        plugin_root = Path(sys.argv[1])
-    else:
-        # Use current directory
-        plugin_root = Path.cwd()
+def _run_validator(plugin_root: Path) -> Tuple[PluginValidator, int]:
+    """
+    Validate a plugin and work out the exit code, without printing anything.
 
-    # Ensure it's absolute
-    plugin_root = plugin_root.resolve()
+    Args:
+        plugin_root: Absolute path to the plugin root directory
 
-    # Validate
+    Returns:
+        Tuple of (validator, exit code). If validation raised, the exit code
+        is 2 and the fatal error is the validator's last error
+    """
     validator = PluginValidator(plugin_root)
 
     try:
-        is_valid = validator.validate()
+        validator.validate()
     except Exception as e:
-        print(f"Fatal error during validation: {e}", file=sys.stderr)
-        return 2
+        validator.errors.append(f"Fatal error during validation: {e}")
+        return validator, 2
+
+    # Return appropriate exit code
+    if validator.errors:
+        return validator, 1
+    return validator, 0
+
+
+def _validate_and_report(plugin_root: Path) -> int:
+    """
+    Validate a plugin, print the report and return the exit code.
+
+    Args:
+        plugin_root: Absolute path to the plugin root directory
+    """
+    validator, returncode = _run_validator(plugin_root)
+
+    if returncode == 2:
+        print(validator.errors[-1], file=sys.stderr)
+        return returncode
 
     # Print report
     validator.print_report()
+    return returncode
+
+
+def validate(plugin_root) -> Tuple[int, str, str]:
+    """
+    Validate a plugin without writing to the real stdout/stderr.
+
+    Args:
+        plugin_root: Path to the plugin root directory
+
+    Returns:
+        Tuple of (exit code, stdout text, stderr text), matching what a run
+        of this script on the same path would produce
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = _validate_and_report(Path(plugin_root).resolve())
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+def validate_many(plugin_roots) -> List[Dict]:
+    """
+    Validate several plugins without printing anything.
+
+    Args:
+        plugin_roots: Paths to the plugin root directories
+
+    Returns:
+        One dict per plugin, in order, with its resolved path, exit code,
+        errors and warnings
+    """
+    results = []
+    for plugin_root in plugin_roots:
+        plugin_root = Path(plugin_root).resolve()
+        validator, returncode = _run_validator(plugin_root)
+        results.append({
+            "path": str(plugin_root),
+            "returncode": returncode,
+            "errors": validator.errors,
+            "warnings": validator.warnings,
+        })
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point.
+
+    Args:
+        argv: Command-line arguments excluding the program name.
+            Defaults to sys.argv[1:].
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) > 1:
+        results = validate_many(argv)
+        print(json.dumps(results, indent=2))
+        return max(result["returncode"] for result in results)
 
-    # Return appropriate exit code
-    if validator.errors:
-        return 1
-    return 0
+    # Get plugin directory
+    if argv:
+        plugin_root = Path(argv[0])
+    else:
+        # Use current directory
+        plugin_root = Path.cwd()
+
+    # Ensure it's absolute
+    plugin_root = plugin_root.resolve()
+
+    return _validate_and_report(plugin_root)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,304 @@
+"""
+Shared pytest fixtures for the cc-plugins test suite.
+
+Read-only project artifacts (README, plugin manifest) are loaded once per
+session and shared across test modules.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import subprocess
+import importlib.util
+import pytest
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ROOT = Path(__file__).resolve().parent.parent
+_README = _ROOT / "README.md"
+_PLUGIN_JSON = _ROOT / ".claude-plugin" / "plugin.json"
+_SCRIPTS = _ROOT / "scripts"
+
+# Manifest of the minimal valid plugin built by the plugin_template fixture
+_TEMPLATE_MANIFEST = {
+    "name": "template-plugin",
+    "version": "1.0.0",
+    "description": "Test plugin"
+}
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize obj as compact JSON bytes, using orjson when available."""
+    # Only the validator reads test manifests back, so no indentation
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _tmpfs_base():
+    """Returns a RAM-backed directory for scratch files, or None for the default."""
+    base = os.environ.get("CC_PLUGINS_TMPFS")
+    if base:
+        return base
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "e2e: end-to-end tests that fork subprocesses"
+    )
+
+
+@pytest.fixture(scope="session")
+def tmpfs_root(tmp_path_factory):
+    """
+    Returns a session scratch directory, on tmpfs when one is available.
+
+    Uses $CC_PLUGINS_TMPFS if set, else /dev/shm when writable, else a
+    directory under pytest's basetemp. Tests create their own
+    subdirectories inside it; the whole tree is removed at session end.
+    """
+    base = _tmpfs_base()
+    if base is None:
+        yield tmp_path_factory.mktemp("scratch")
+        return
+    root = Path(tempfile.mkdtemp(prefix="cc_plugins_tests_", dir=base))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def readme_content():
+    """Returns README.md content, read once per session."""
+    return _README.read_text()
+
+
+@pytest.fixture(scope="session")
+def readme_content_lower(readme_content):
+    """Returns lowercased README.md content, computed once per session."""
+    return readme_content.lower()
+
+
+@pytest.fixture(scope="session")
+def plugin_root():
+    """Returns the path to the cc-plugins plugin root directory."""
+    return _ROOT
+
+
+@pytest.fixture(scope="session")
+def plugin_manifest():
+    """Returns the parsed plugin manifest, parsed once per session."""
+    return _json_loads(_PLUGIN_JSON.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def write_manifest():
+    """Returns a function that writes a manifest dict to a plugin.json path."""
+    def write(path, manifest):
+        Path(path).write_bytes(_json_dumps(manifest))
+    return write
+
+
+@pytest.fixture(scope="session")
+def patch_manifest(write_manifest):
+    """
+    Returns a function that updates fields of a plugin.json in place.
+
+    The function reads the manifest at path, sets the given keyword fields,
+    writes it back and returns the updated dict.
+    """
+    def patch(path, **fields):
+        manifest = _json_loads(Path(path).read_bytes())
+        manifest.update(fields)
+        write_manifest(path, manifest)
+        return manifest
+    return patch
+
+
+@pytest.fixture(scope="session")
+def command_files():
+    """Returns the stems of command files, listed once per session."""
+    commands_dir = _ROOT / "commands"
+    if not commands_dir.exists():
+        return ()
+    return tuple(f.stem for f in commands_dir.glob("*.md"))
+
+
+@pytest.fixture(scope="session")
+def agent_files():
+    """Returns the stems of agent files, listed once per session."""
+    agents_dir = _ROOT / "agents"
+    if not agents_dir.exists():
+        return ()
+    return tuple(f.stem for f in agents_dir.glob("*.md"))
+
+
+@pytest.fixture(scope="session")
+def skill_dirs():
+    """Returns the names of skill directories, listed once per session."""
+    skills_dir = _ROOT / "skills"
+    if not skills_dir.exists():
+        return ()
+    # DirEntry.is_dir() uses the cached d_type instead of a stat per child
+    with os.scandir(skills_dir) as entries:
+        return tuple(e.name for e in entries if e.is_dir())
+
+
+@pytest.fixture(scope="session")
+def plugin_template(tmp_path_factory):
+    """
+    Returns a minimal valid plugin directory, built once per session.
+
+    Tests copy it with shutil.copytree and overwrite plugin.json only when
+    they need a different manifest. The template itself must not be modified.
+    """
+    template = tmp_path_factory.mktemp("template") / "template-plugin"
+    (template / ".claude-plugin").mkdir(parents=True)
+    (template / ".claude-plugin" / "plugin.json").write_bytes(_json_dumps(_TEMPLATE_MANIFEST))
+    return template
+
+
+@pytest.fixture(scope="session")
+def validator_source():
+    """Returns the source of scripts/validate-plugin.py, read once per session."""
+    return (_SCRIPTS / "validate-plugin.py").read_text()
+
+
+@pytest.fixture(scope="session")
+def create_bash_script():
+    """Returns the bash script embedded in create.md, extracted once per session."""
+    content = (_ROOT / "commands" / "create.md").read_text()
+    bash_start = content.find("!bash\n")
+    if bash_start == -1:
+        raise ValueError("No bash script found in create.md")
+    return content[bash_start + 6:]  # Skip "!bash\n"
+
+
+@pytest.fixture(scope="session")
+def create_script_path(tmp_path_factory, create_bash_script):
+    """Write the create.md bash script to a file once per session."""
+    script_path = tmp_path_factory.mktemp("cc") / "create.sh"
+    script_path.write_text(create_bash_script)
+    script_path.chmod(0o755)
+    return script_path
+
+
+@pytest.fixture(scope="session")
+def run_create(create_script_path):
+    """
+    Returns a function that runs the create command's bash script.
+
+    The function takes the plugin name, a keyword-only cwd and the optional
+    description, author and license, and returns the
+    subprocess.CompletedProcess. With capture=False, output is discarded and
+    only the return code is meaningful.
+    """
+    def run(plugin_name, *, cwd, description=None, author=None, license=None, capture=True):
+        cmd = ["bash", str(create_script_path), plugin_name]
+        if description:
+            cmd.extend(["--description", description])
+        if author:
+            cmd.extend(["--author", author])
+        if license:
+            cmd.extend(["--license", license])
+        if not capture:
+            return subprocess.run(
+                cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    return run
+
+
+@pytest.fixture(scope="session")
+def format_checker_module():
+    """Returns scripts/check-formats.py imported as a module, loaded once per session."""
+    spec = importlib.util.spec_from_file_location(
+        "check_formats", _SCRIPTS / "check-formats.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def validator_module():
+    """Returns scripts/validate-plugin.py imported as a module, loaded once per session."""
+    spec = importlib.util.spec_from_file_location(
+        "validate_plugin", _SCRIPTS / "validate-plugin.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _tree_digest(root):
+    """Returns a digest of every directory, file name and file content under root."""
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, root).encode()
+        digest.update(b"d%d:%s" % (len(rel), rel))
+        for name in sorted(filenames):
+            with open(os.path.join(dirpath, name), "rb") as f:
+                data = f.read()
+            encoded = name.encode()
+            digest.update(b"f%d:%s%d:" % (len(encoded), encoded, len(data)))
+            digest.update(data)
+    return digest.digest()
+
+
+@pytest.fixture(scope="session")
+def validator(validator_module):
+    """
+    Returns the in-process validate(path) -> (returncode, stdout, stderr) function.
+
+    The validator module is imported once per session, so no test pays for
+    interpreter startup or recompiling the script. Results are memoized by
+    the plugin directory's contents: a tree identical to one already
+    validated (e.g. the same "fixed" manifest in another test) is not
+    validated again. The validator only refers to the plugin by its full
+    path, which is rewritten in cached output to the path of this call.
+    """
+    results = {}
+
+    def validate(plugin_dir):
+        root = str(Path(plugin_dir).resolve())
+        key = (os.path.isdir(root), os.path.exists(root), _tree_digest(root))
+        if key not in results:
+            returncode, stdout, stderr = validator_module.validate(root)
+            results[key] = (returncode, stdout.replace(root, "\0"), stderr.replace(root, "\0"))
+        returncode, stdout, stderr = results[key]
+        return returncode, stdout.replace("\0", root), stderr.replace("\0", root)
+
+    return validate
+
+
+@pytest.fixture(scope="session")
+def run_validator(validator):
+    """
+    Returns a function that validates a plugin directory in-process.
+
+    The function takes a plugin directory and returns a
+    subprocess.CompletedProcess with the exit code and captured output, the
+    same shape as running scripts/validate-plugin.py in a subprocess.
+    """
+    def run(plugin_dir):
+        returncode, stdout, stderr = validator(plugin_dir)
+        return subprocess.CompletedProcess([str(plugin_dir)], returncode, stdout, stderr)
+    return run
@@ -13,13 +13,6 @@ import os
 import json
 import pytest
 import yaml
-from pathlib import Path
-
-
-@pytest.fixture
-def plugin_root():
-    """Returns the path to the cc-plugins plugin root directory."""
-    return Path(__file__).parent.parent
 
 
 @pytest.fixture
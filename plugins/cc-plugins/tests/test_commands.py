@@ -18,12 +18,6 @@ import subprocess
 from pathlib import Path
 
 
-@pytest.fixture
-def plugin_root():
-    """Returns the path to the cc-plugins plugin root directory."""
-    return Path(__file__).parent.parent
-
-
 @pytest.fixture
 def commands_dir(plugin_root):
     """Returns the path to the commands directory."""
@@ -12,182 +12,209 @@ Test Coverage:
 - Documentation generation for created plugins
 - Component creation (commands, agents, skills)
 - Cleanup of test plugins
+
+Tests only write inside their own temp_workspace. The session-scoped golden
+plugin is read-only and must be copied with _copy_plugin() before it is
+modified, which keeps the module safe under pytest -n auto --dist loadfile.
 """
 
+import os
+import re
+import stat
 import json
-import subprocess
 import tempfile
+import functools
 import pytest
 from pathlib import Path
 import shutil
 
+pytestmark = pytest.mark.e2e
+
+# Name of the plugin created once per session by the golden_plugin fixture
+GOLDEN_PLUGIN_NAME = "test-golden-plugin"
+
+# Matches the create script's duplicate-name error without lowercasing output
+_ALREADY_EXISTS_RE = re.compile(r"already exists", re.IGNORECASE)
+
+# Plugin name rule, mirrored from the validation in commands/create.md. In
+# bash's =~, $ only matches at the very end; Python's $ also matches before a
+# trailing newline, so the compiled rule anchors with \Z instead
+_NAME_PATTERN = r"^[a-z0-9]+(-[a-z0-9]+)*$"
+_NAME_RE = re.compile(_NAME_PATTERN[:-1] + r"\Z")
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_create(run_create, cache_root, plugin_name, description=None,
+                   author=None, license=None):
+    """
+    Run the create script once per distinct set of inputs.
+
+    Each distinct call creates the plugin in its own directory under
+    cache_root. Callers copy the returned plugin directory and must not
+    modify it.
+
+    Returns:
+        Tuple of (subprocess.CompletedProcess, created plugin directory)
+    """
+    cwd = Path(tempfile.mkdtemp(dir=cache_root))
+    result = run_create(
+        plugin_name, cwd=cwd,
+        description=description, author=author, license=license
+    )
+    return result, cwd / plugin_name
+
+
+def _set_tree_writable(root, writable):
+    """Add or remove write permission on every directory and file under root."""
+    write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for path in [dirpath] + [os.path.join(dirpath, f) for f in filenames]:
+            mode = stat.S_IMODE(os.lstat(path).st_mode)
+            os.chmod(path, mode | stat.S_IWUSR if writable else mode & ~write_bits)
+
+
+def _copy_plugin(src, dst):
+    """Copy a (possibly read-only) plugin tree and make the copy writable."""
+    shutil.copytree(src, dst)
+    _set_tree_writable(dst, True)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_manifest(path_str, mtime_ns):
+    """Parse a manifest file; cached per path and modification time."""
+    return json.loads(Path(path_str).read_bytes())
+
+
+def _load_manifest(manifest_path):
+    """Return the parsed manifest, re-reading it only when the file changes."""
+    return _parse_manifest(str(manifest_path), manifest_path.stat().st_mtime_ns)
+
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path_factory):
     """Create a temporary workspace for test plugins."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        yield workspace
-        # Cleanup handled automatically by tempfile
+    # Cleanup of old workspaces is handled by pytest's tmp path retention
+    return tmp_path_factory.mktemp("ws")
 
 
-@pytest.fixture
-def cc_plugins_root():
-    """Returns the path to the cc-plugins root directory."""
-    return Path(__file__).parent.parent
+@pytest.fixture(scope="session")
+def create_cache_root(tmp_path_factory):
+    """Directory holding plugins created by _cached_create."""
+    return tmp_path_factory.mktemp("created")
+
+
+@pytest.fixture(scope="session")
+def golden_plugin(run_create, create_cache_root):
+    """Create one plugin per session for tests that only need a pre-created plugin."""
+    result, plugin_dir = _cached_create(run_create, create_cache_root, GOLDEN_PLUGIN_NAME)
+    assert result.returncode == 0, f"Create command failed: {result.stderr}"
+    return plugin_dir
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _freeze_golden(golden_plugin):
+    """Make the shared golden plugin read-only so accidental writes fail fast."""
+    _set_tree_writable(golden_plugin, False)
+    yield
+    _set_tree_writable(golden_plugin, True)
 
 
 class TestBasicPluginCreation:
     """Test basic plugin creation functionality."""
 
-    def test_create_plugin_with_default_parameters(self, temp_workspace, cc_plugins_root):
+    def test_create_plugin_with_default_parameters(self, temp_workspace, run_create,
+                                                   create_cache_root):
         """Test creating a plugin with only a name parameter."""
-        plugin_name = "test-basic-plugin"
-        create_cmd = cc_plugins_root / "commands" / "create.md"
+        # Same inputs as the golden plugin, so the cached creation is reused
+        plugin_name = GOLDEN_PLUGIN_NAME
 
-        # Extract and execute the bash script from create.md
-        result = self._execute_create_command(
-            create_cmd,
-            plugin_name,
-            cwd=temp_workspace
-        )
+        result, created_dir = _cached_create(run_create, create_cache_root, plugin_name)
 
         assert result.returncode == 0, f"Create command failed: {result.stderr}"
 
         # Verify plugin directory was created
+        assert created_dir.exists(), f"Plugin directory not created: {created_dir}"
         plugin_dir = temp_workspace / plugin_name
-        assert plugin_dir.exists(), f"Plugin directory not created: {plugin_dir}"
+        _copy_plugin(created_dir, plugin_dir)
         assert plugin_dir.is_dir(), f"Plugin path is not a directory: {plugin_dir}"
 
         # Verify basic structure
         self._verify_plugin_structure(plugin_dir, plugin_name)
 
-    def test_create_plugin_with_custom_metadata(self, temp_workspace, cc_plugins_root):
+    def test_create_plugin_with_custom_metadata(self, temp_workspace, run_create,
+                                                create_cache_root):
         """Test creating a plugin with custom description, author, and license."""
         plugin_name = "test-custom-plugin"
         description = "A test plugin with custom metadata"
         author = "Test Author"
         license_type = "Apache-2.0"
 
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-
-        result = self._execute_create_command(
-            create_cmd,
+        result, created_dir = _cached_create(
+            run_create,
+            create_cache_root,
             plugin_name,
             description=description,
             author=author,
-            license=license_type,
-            cwd=temp_workspace
+            license=license_type
         )
 
         assert result.returncode == 0, f"Create command failed: {result.stderr}"
 
         # Verify plugin directory
+        assert created_dir.exists()
         plugin_dir = temp_workspace / plugin_name
-        assert plugin_dir.exists()
+        _copy_plugin(created_dir, plugin_dir)
 
         # Verify custom metadata in manifest
         manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = _load_manifest(manifest_path)
 
         assert manifest["name"] == plugin_name
         assert manifest["description"] == description
         assert manifest["author"]["name"] == author
         assert manifest["license"] == license_type
 
-    def test_create_plugin_with_invalid_name(self, temp_workspace, cc_plugins_root):
+    @pytest.mark.parametrize("invalid_name", [
+        "Test_Plugin",  # Underscore
+        "Test Plugin",  # Space
+        "TestPlugin",   # CamelCase
+        "test-plugin-", # Trailing hyphen
+        "-test-plugin", # Leading hyphen
+        "test--plugin", # Double hyphen
+        "test-plugin\n", # Trailing newline
+    ])
+    def test_create_plugin_with_invalid_name(self, invalid_name, temp_workspace,
+                                             create_bash_script, run_create):
         """Test that invalid plugin names are rejected."""
-        invalid_names = [
-            "Test_Plugin",  # Underscore
-            "Test Plugin",  # Space
-            "TestPlugin",   # CamelCase
-            "test-plugin-", # Trailing hyphen
-            "-test-plugin", # Leading hyphen
-            "test--plugin", # Double hyphen
-        ]
-
-        create_cmd = cc_plugins_root / "commands" / "create.md"
+        # The Python rule must stay in sync with the one the script enforces
+        assert _NAME_PATTERN in create_bash_script, "Name regex in create.md has changed"
+        assert not _NAME_RE.match(invalid_name), f"Should reject invalid name: {invalid_name!r}"
 
-        for invalid_name in invalid_names:
-            result = self._execute_create_command(
-                create_cmd,
-                invalid_name,
-                cwd=temp_workspace
-            )
+        # And the script itself must exit non-zero
+        result = run_create(invalid_name, cwd=temp_workspace, capture=False)
+        assert result.returncode != 0, f"Script should reject invalid name: {invalid_name!r}"
 
-            # Should fail for invalid names
-            assert result.returncode != 0, f"Should reject invalid name: {invalid_name}"
-
-    def test_create_plugin_duplicate_name(self, temp_workspace, cc_plugins_root):
+    def test_create_plugin_duplicate_name(self, temp_workspace, run_create):
         """Test that creating a plugin with an existing name fails."""
         plugin_name = "test-duplicate-plugin"
-        create_cmd = cc_plugins_root / "commands" / "create.md"
 
         # Create first plugin
-        result1 = self._execute_create_command(
-            create_cmd,
+        result1 = run_create(
             plugin_name,
-            cwd=temp_workspace
+            cwd=temp_workspace,
+            capture=False
         )
         assert result1.returncode == 0
 
         # Try to create duplicate
-        result2 = self._execute_create_command(
-            create_cmd,
+        result2 = run_create(
             plugin_name,
             cwd=temp_workspace
         )
 
         # Should fail due to existing directory
         assert result2.returncode != 0
-        assert "already exists" in result2.stderr.lower() or "already exists" in result2.stdout.lower()
-
-    def _execute_create_command(self, create_cmd, plugin_name, description=None,
-                                 author=None, license=None, cwd=None):
-        """
-        Execute the create command bash script.
-
-        Args:
-            create_cmd: Path to create.md file
-            plugin_name: Name of plugin to create
-            description: Optional description
-            author: Optional author name
-            license: Optional license type
-            cwd: Working directory for execution
-
-        Returns:
-            subprocess.CompletedProcess result
-        """
-        # Extract bash script from create.md
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        # Find the bash script section
-        bash_start = content.find("!bash\n")
-        if bash_start == -1:
-            raise ValueError("No bash script found in create.md")
-
-        bash_script = content[bash_start + 6:]  # Skip "!bash\n"
-
-        # Build command arguments
-        args = [plugin_name]
-        if description:
-            args.extend(["--description", description])
-        if author:
-            args.extend(["--author", author])
-        if license:
-            args.extend(["--license", license])
-
-        # Execute bash script
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash"] + args,
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
+        assert _ALREADY_EXISTS_RE.search(result2.stderr) or _ALREADY_EXISTS_RE.search(result2.stdout)
 
     def _verify_plugin_structure(self, plugin_dir, plugin_name):
         """Verify that created plugin has correct structure."""
@@ -202,10 +229,14 @@ class TestBasicPluginCreation:
             "tests"
         ]
 
+        # One directory read instead of two stat calls per entry
+        with os.scandir(plugin_dir) as it:
+            entries = {entry.name: entry for entry in it}
+
         for dir_name in required_dirs:
-            dir_path = plugin_dir / dir_name
-            assert dir_path.exists(), f"Missing directory: {dir_name}"
-            assert dir_path.is_dir(), f"Not a directory: {dir_name}"
+            entry = entries.get(dir_name)
+            assert entry is not None, f"Missing directory: {dir_name}"
+            assert entry.is_dir(follow_symlinks=False), f"Not a directory: {dir_name}"
 
         # Check required files
         assert (plugin_dir / ".claude-plugin" / "plugin.json").exists()
@@ -215,8 +246,7 @@ class TestBasicPluginCreation:
 
         # Verify manifest is valid JSON
         manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = _load_manifest(manifest_path)
 
         assert manifest["name"] == plugin_name
         assert "version" in manifest
@@ -226,43 +256,32 @@ class TestBasicPluginCreation:
 class TestCreatedPluginValidation:
     """Test that created plugins pass validation."""
 
-    def test_created_plugin_passes_validation(self, temp_workspace, cc_plugins_root):
+    def test_created_plugin_passes_validation(self, temp_workspace, run_validator, golden_plugin):
         """Test that a newly created plugin passes validation."""
         plugin_name = "test-valid-plugin"
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+        # Copy the session-created plugin
+        _copy_plugin(golden_plugin, temp_workspace / plugin_name)
 
         # Validate plugin
         plugin_dir = temp_workspace / plugin_name
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, f"Validation failed: {result.stdout}\n{result.stderr}"
         assert "✓" in result.stdout or "passed" in result.stdout.lower()
 
-    def test_created_plugin_has_valid_manifest(self, temp_workspace, cc_plugins_root):
+    def test_created_plugin_has_valid_manifest(self, temp_workspace, golden_plugin):
         """Test that created plugin manifest is valid."""
-        plugin_name = "test-manifest-plugin"
+        plugin_name = GOLDEN_PLUGIN_NAME
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+        # Copy the session-created plugin
+        _copy_plugin(golden_plugin, temp_workspace / plugin_name)
 
         # Check manifest structure
         plugin_dir = temp_workspace / plugin_name
         manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
 
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = _load_manifest(manifest_path)
 
         # Verify required and optional fields
         assert "name" in manifest
@@ -279,35 +298,16 @@ class TestCreatedPluginValidation:
         assert "description" in manifest
         assert "license" in manifest
 
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
-
 
 class TestComponentCreation:
     """Test creating components in a new plugin."""
 
-    def test_can_add_command_to_created_plugin(self, temp_workspace, cc_plugins_root):
+    def test_can_add_command_to_created_plugin(self, temp_workspace, run_validator, golden_plugin):
         """Test adding a command file to a newly created plugin."""
         plugin_name = "test-command-plugin"
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+        # Copy the session-created plugin
+        _copy_plugin(golden_plugin, temp_workspace / plugin_name)
 
         # Add a command file
         plugin_dir = temp_workspace / plugin_name
@@ -331,23 +331,16 @@ echo "Hello from test command"
         command_file.write_text(command_content)
 
         # Validate the plugin with the new command
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, f"Validation failed: {result.stdout}"
 
-    def test_can_add_agent_to_created_plugin(self, temp_workspace, cc_plugins_root):
+    def test_can_add_agent_to_created_plugin(self, temp_workspace, run_validator, golden_plugin):
         """Test adding an agent file to a newly created plugin."""
         plugin_name = "test-agent-plugin"
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+        # Copy the session-created plugin
+        _copy_plugin(golden_plugin, temp_workspace / plugin_name)
 
         # Add an agent file
         plugin_dir = temp_workspace / plugin_name
@@ -367,23 +360,16 @@ This is a test agent.
         agent_file.write_text(agent_content)
 
         # Validate the plugin with the new agent
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, f"Validation failed: {result.stdout}"
 
-    def test_can_add_skill_to_created_plugin(self, temp_workspace, cc_plugins_root):
+    def test_can_add_skill_to_created_plugin(self, temp_workspace, run_validator, golden_plugin):
         """Test adding a skill to a newly created plugin."""
         plugin_name = "test-skill-plugin"
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+        # Copy the session-created plugin
+        _copy_plugin(golden_plugin, temp_workspace / plugin_name)
 
         # Add a skill directory and SKILL.md
         plugin_dir = temp_workspace / plugin_name
@@ -405,56 +391,21 @@ This is a test skill.
         skill_file.write_text(skill_content)
 
         # Validate the plugin with the new skill
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, f"Validation failed: {result.stdout}"
 
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
-
 
 class TestPluginCreationCleanup:
     """Test cleanup of created test plugins."""
 
-    def test_cleanup_removes_all_test_artifacts(self, temp_workspace, cc_plugins_root):
+    def test_cleanup_removes_all_test_artifacts(self, temp_workspace, golden_plugin):
         """Test that temporary plugins are properly cleaned up."""
         plugin_name = "test-cleanup-plugin"
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=temp_workspace,
-            capture_output=True,
-            text=True
-        )
-
+        # Copy the session-created plugin
         plugin_dir = temp_workspace / plugin_name
+        _copy_plugin(golden_plugin, plugin_dir)
         assert plugin_dir.exists()
 
         # Cleanup (simulate)
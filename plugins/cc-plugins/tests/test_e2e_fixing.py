@@ -13,257 +13,59 @@ Test Coverage:
 - Verification that fixes resolve issues
 """
 
-import json
-import subprocess
 import tempfile
 import pytest
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _run_concurrently(*actions):
+    """Run independent setup actions on a small thread pool, re-raising errors."""
+    with ThreadPoolExecutor(max_workers=len(actions)) as pool:
+        for future in [pool.submit(action) for action in actions]:
+            future.result()
 
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmpfs_root):
     """Create a temporary workspace for broken test plugins."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=tmpfs_root) as tmpdir:
         workspace = Path(tmpdir)
         yield workspace
 
 
-@pytest.fixture
-def cc_plugins_root():
-    """Returns the path to the cc-plugins root directory."""
-    return Path(__file__).parent.parent
-
-
-class TestMissingManifest:
-    """Test detection and fixing of missing manifest file."""
-
-    def test_detects_missing_manifest(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects missing plugin.json manifest."""
-        # Create broken plugin without manifest
-        plugin_dir = temp_workspace / "broken-no-manifest"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-        # Don't create plugin.json
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-        assert "missing" in result.stdout.lower() and "manifest" in result.stdout.lower()
-
-    def test_fix_missing_manifest(self, temp_workspace, cc_plugins_root):
-        """Test that creating manifest file fixes the issue."""
-        # Create broken plugin
-        plugin_dir = temp_workspace / "broken-no-manifest-fix"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-
-        # Fix: Create minimal manifest
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": "broken-no-manifest-fix",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-
-
-class TestInvalidJSON:
-    """Test detection and fixing of invalid JSON in manifest."""
-
-    def test_detects_invalid_json_manifest(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects malformed JSON in manifest."""
-        # Create broken plugin with invalid JSON
-        plugin_dir = temp_workspace / "broken-invalid-json"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        # Write invalid JSON (trailing comma, missing quote)
-        manifest_path.write_text("""
+# Broken plugins shared by the detection and fix tests. Each fix test starts
+# from the same tree as its detection test, so the memoized validator
+# fixture answers the "verify it's broken" step without validating again.
+
+# Invalid JSON (trailing comma, missing quote)
+_INVALID_JSON = """
 {
   "name": "broken-plugin",
   "version": "1.0.0",
   "description": "Test plugin,
 }
-""")
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-        assert "invalid json" in result.stdout.lower() or "json" in result.stdout.lower()
-
-    def test_fix_invalid_json_manifest(self, temp_workspace, cc_plugins_root):
-        """Test that fixing JSON syntax resolves the issue."""
-        # Create broken plugin
-        plugin_dir = temp_workspace / "broken-invalid-json-fix"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest_path.write_text("""
-{
-  "name": "broken-plugin",
+"""
+
+# Manifest without the required 'name' field
+_MISSING_NAME_MANIFEST = b"""{
   "version": "1.0.0",
-  "description": "Test plugin,
+  "description": "Test plugin"
 }
-""")
-
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-
-        # Fix: Write valid JSON
-        manifest = {
-            "name": "broken-invalid-json-fix",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-
-
-class TestWrongDirectoryStructure:
-    """Test detection and fixing of wrong directory structure."""
-
-    def test_detects_components_in_wrong_location(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects components inside .claude-plugin."""
-        # Create broken plugin with components in wrong place
-        plugin_dir = temp_workspace / "broken-wrong-structure"
-        plugin_dir.mkdir()
-        claude_plugin_dir = plugin_dir / ".claude-plugin"
-        claude_plugin_dir.mkdir()
-
-        # Create manifest
-        manifest_path = claude_plugin_dir / "plugin.json"
-        manifest = {
-            "name": "broken-wrong-structure",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Put components in WRONG location (.claude-plugin)
-        (claude_plugin_dir / "commands").mkdir()
-        (claude_plugin_dir / "agents").mkdir()
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-        assert "wrong location" in result.stdout.lower() or "root level" in result.stdout.lower()
-
-    def test_fix_wrong_directory_structure(self, temp_workspace, cc_plugins_root):
-        """Test that moving components to root fixes the issue."""
-        # Create broken plugin
-        plugin_dir = temp_workspace / "broken-wrong-structure-fix"
-        plugin_dir.mkdir()
-        claude_plugin_dir = plugin_dir / ".claude-plugin"
-        claude_plugin_dir.mkdir()
-
-        manifest_path = claude_plugin_dir / "plugin.json"
-        manifest = {
-            "name": "broken-wrong-structure-fix",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Put components in WRONG location
-        (claude_plugin_dir / "commands").mkdir()
+"""
+
+# Manifest whose name should be kebab-case
+_INVALID_NAME_MANIFEST = b"""{
+  "name": "Invalid_Name_Format",
+  "version": "1.0.0",
+  "description": "Test plugin"
+}
+"""
 
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-
-        # Fix: Move commands to root level
-        shutil.move(
-            str(claude_plugin_dir / "commands"),
-            str(plugin_dir / "commands")
-        )
-
-        # Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-
-
-class TestInvalidFrontmatter:
-    """Test detection and fixing of invalid frontmatter syntax."""
-
-    def test_detects_invalid_frontmatter_in_command(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects invalid frontmatter in command file."""
-        # Create plugin with invalid command frontmatter
-        plugin_dir = self._create_valid_plugin(temp_workspace, "broken-invalid-frontmatter")
-
-        # Create command with invalid frontmatter
-        commands_dir = plugin_dir / "commands"
-        commands_dir.mkdir(exist_ok=True)
-
-        command_file = commands_dir / "test.md"
-        # Missing closing --- for frontmatter
-        command_file.write_text("""---
+# Command files, kept as bytes so tests write them without re-encoding.
+# Missing closing --- for frontmatter
+_UNCLOSED_FRONTMATTER_COMMAND = b"""---
 description: "Test command"
 allowed-tools: ["Bash"]
 model: "sonnet"
@@ -271,47 +73,16 @@ model: "sonnet"
 # Test Command
 
 This is broken.
-""")
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-
-    def test_fix_invalid_frontmatter(self, temp_workspace, cc_plugins_root):
-        """Test that fixing frontmatter syntax resolves the issue."""
-        # Create plugin with invalid frontmatter
-        plugin_dir = self._create_valid_plugin(temp_workspace, "broken-invalid-frontmatter-fix")
-
-        commands_dir = plugin_dir / "commands"
-        commands_dir.mkdir(exist_ok=True)
+"""
 
-        command_file = commands_dir / "test.md"
-        command_file.write_text("""---
-description: "Test command"
-allowed-tools: ["Bash"]
-model: "sonnet"
+# Closing --- missing and only a description
+_BARE_UNCLOSED_COMMAND = b"""---
+description: "Test"
+# Missing closing ---
+"""
 
-# Test Command
-""")
-
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-
-        # Fix: Add closing --- and required fields
-        command_file.write_text("""---
+# Closed frontmatter with all fields the validator expects
+_FIXED_COMMAND = b"""---
 description: "Test command"
 allowed-tools: ["Bash"]
 argument-hint: "No arguments"
@@ -322,292 +93,295 @@ disable-model-invocation: false
 # Test Command
 
 This is fixed.
-""")
-
-        # Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-
-    def _create_valid_plugin(self, workspace, name):
-        """Helper to create a valid plugin structure."""
-        plugin_dir = workspace / name
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": name,
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        return plugin_dir
-
-
-class TestUnsupportedFields:
-    """Test detection of unsupported manifest fields."""
-
-    def test_detects_unsupported_manifest_fields(self, temp_workspace, cc_plugins_root):
-        """Test that validator warns about unsupported fields in manifest."""
-        # Create plugin with unsupported fields
-        plugin_dir = temp_workspace / "broken-unsupported-fields"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": "broken-unsupported-fields",
-            "version": "1.0.0",
-            "description": "Test plugin",
-            "unsupportedField": "This field doesn't exist in spec",
-            "anotherBadField": 123
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should warn about unsupported fields
-        output = result.stdout.lower()
-        assert "unsupported" in output or "warning" in output
-
-    def test_fix_unsupported_fields(self, temp_workspace, cc_plugins_root):
-        """Test that removing unsupported fields resolves warnings."""
-        # Create plugin with unsupported fields
-        plugin_dir = temp_workspace / "broken-unsupported-fields-fix"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": "broken-unsupported-fields-fix",
-            "version": "1.0.0",
-            "description": "Test plugin",
-            "badField": "Remove this"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify warning exists
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        output_before = result.stdout.lower()
-
-        # Fix: Remove unsupported field
-        manifest = {
-            "name": "broken-unsupported-fields-fix",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify fix (no warnings)
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        output_after = result.stdout.lower()
-
-        # After fix, should have no warnings about unsupported fields
-        assert result.returncode == 0
-
-
-class TestInvalidManifestSchema:
-    """Test detection and fixing of invalid manifest schema."""
-
-    def test_detects_missing_required_field(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects missing 'name' field."""
-        # Create plugin without name field
-        plugin_dir = temp_workspace / "broken-no-name"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "version": "1.0.0",
-            "description": "Test plugin"
-            # Missing 'name' field
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-        assert "name" in result.stdout.lower() and "required" in result.stdout.lower()
-
-    def test_detects_invalid_name_format(self, temp_workspace, cc_plugins_root):
-        """Test that validator detects non-kebab-case names."""
-        # Create plugin with invalid name format
-        plugin_dir = temp_workspace / "broken-invalid-name"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": "Invalid_Name_Format",  # Should be kebab-case
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        # Should fail
-        assert result.returncode != 0
-        assert "kebab" in result.stdout.lower() or "lowercase" in result.stdout.lower()
-
-    def test_fix_invalid_name_format(self, temp_workspace, cc_plugins_root):
-        """Test that fixing name format resolves the issue."""
-        # Create plugin with invalid name
-        plugin_dir = temp_workspace / "broken-invalid-name-fix"
-        plugin_dir.mkdir()
-        (plugin_dir / ".claude-plugin").mkdir()
-
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        manifest = {
-            "name": "Invalid_Name",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-
-        # Fix: Use kebab-case
-        manifest = {
-            "name": "broken-invalid-name-fix",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-
-
-class TestComplexFixingScenarios:
-    """Test fixing plugins with multiple issues."""
-
-    def test_fix_plugin_with_multiple_issues(self, temp_workspace, cc_plugins_root):
-        """Test fixing a plugin with multiple validation errors."""
-        # Create plugin with multiple issues
-        plugin_dir = temp_workspace / "broken-multiple-issues"
-        plugin_dir.mkdir()
-        claude_plugin_dir = plugin_dir / ".claude-plugin"
-        claude_plugin_dir.mkdir()
-
-        # Issue 1: Invalid manifest (wrong name format)
-        manifest_path = claude_plugin_dir / "plugin.json"
-        manifest = {
-            "name": "Invalid_Name",  # Wrong format
-            "version": "1.0.0",
-            "badField": "unsupported"  # Unsupported field
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+"""
+
 
+def _build_missing_manifest(template, plugin_dir):
+    """Plugin with a .claude-plugin directory but no plugin.json."""
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+
+
+def _build_invalid_json(template, plugin_dir):
+    """Plugin whose plugin.json is malformed JSON."""
+    shutil.copytree(template, plugin_dir)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_text(_INVALID_JSON)
+
+
+def _build_wrong_structure(template, plugin_dir):
+    """Plugin with component directories inside .claude-plugin."""
+    shutil.copytree(template, plugin_dir)
+    (plugin_dir / ".claude-plugin" / "commands").mkdir()
+    (plugin_dir / ".claude-plugin" / "agents").mkdir()
+
+
+def _build_invalid_frontmatter(template, plugin_dir):
+    """Plugin with a command whose frontmatter is never closed."""
+    shutil.copytree(template, plugin_dir)
+    (plugin_dir / "commands").mkdir()
+    (plugin_dir / "commands" / "test.md").write_bytes(_UNCLOSED_FRONTMATTER_COMMAND)
+
+
+def _build_missing_name(template, plugin_dir):
+    """Plugin whose manifest lacks the required 'name' field."""
+    shutil.copytree(template, plugin_dir)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_bytes(_MISSING_NAME_MANIFEST)
+
+
+def _build_invalid_name(template, plugin_dir):
+    """Plugin whose manifest name is not kebab-case."""
+    shutil.copytree(template, plugin_dir)
+    (plugin_dir / ".claude-plugin" / "plugin.json").write_bytes(_INVALID_NAME_MANIFEST)
+
+
+# Each row is (builder, keyword groups): the lowercased report must contain at
+# least one keyword from every group
+BROKEN_CASES = [
+    pytest.param(_build_missing_manifest, [("missing",), ("manifest",)], id="missing_manifest"),
+    pytest.param(_build_invalid_json, [("json",)], id="invalid_json"),
+    pytest.param(_build_wrong_structure, [("wrong location", "root level")], id="wrong_structure"),
+    pytest.param(_build_invalid_frontmatter, [], id="invalid_frontmatter"),
+    pytest.param(_build_missing_name, [("name",), ("required",)], id="missing_required_field"),
+    pytest.param(_build_invalid_name, [("kebab", "lowercase")], id="invalid_name_format"),
+]
+
+
+@pytest.mark.parametrize("builder, keyword_groups", BROKEN_CASES)
+def test_detects_broken_plugin(builder, keyword_groups, temp_workspace, validator, plugin_template):
+    """Test that validator rejects each broken plugin with a relevant message."""
+    plugin_dir = temp_workspace / "broken-plugin"
+    builder(plugin_template, plugin_dir)
+
+    # Run validator
+    rc, out, err = validator(plugin_dir)
+
+    # Should fail
+    assert rc != 0
+    output = out.lower()
+    for group in keyword_groups:
+        assert any(keyword in output for keyword in group), \
+            f"Expected one of {group} in validator output:\n{out}"
+
+
+def test_fix_missing_manifest(temp_workspace, validator, plugin_template, write_manifest):
+    """Test that creating manifest file fixes the issue."""
+    # Create broken plugin
+    plugin_dir = temp_workspace / "broken-no-manifest-fix"
+    _build_missing_manifest(plugin_template, plugin_dir)
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+
+    # Fix: Create minimal manifest
+    manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+    manifest = {
+        "name": "broken-no-manifest-fix",
+        "version": "1.0.0",
+        "description": "Test plugin"
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Verify fix
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
+
+
+def test_fix_invalid_json_manifest(temp_workspace, validator, plugin_template, write_manifest):
+    """Test that fixing JSON syntax resolves the issue."""
+    # Create broken plugin
+    plugin_dir = temp_workspace / "broken-invalid-json-fix"
+    _build_invalid_json(plugin_template, plugin_dir)
+    manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+
+    # Fix: Write valid JSON
+    manifest = {
+        "name": "broken-invalid-json-fix",
+        "version": "1.0.0",
+        "description": "Test plugin"
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Verify fix
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
+
+
+def test_fix_wrong_directory_structure(temp_workspace, validator, plugin_template):
+    """Test that moving components to root fixes the issue."""
+    # Create broken plugin
+    plugin_dir = temp_workspace / "broken-wrong-structure-fix"
+    _build_wrong_structure(plugin_template, plugin_dir)
+    claude_plugin_dir = plugin_dir / ".claude-plugin"
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+
+    # Fix: Move components to root level
+    for component in ("commands", "agents"):
+        (claude_plugin_dir / component).rename(plugin_dir / component)
+
+    # Verify fix
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
+
+
+def test_fix_invalid_frontmatter(temp_workspace, validator, plugin_template):
+    """Test that fixing frontmatter syntax resolves the issue."""
+    # Create plugin with invalid frontmatter
+    plugin_dir = temp_workspace / "broken-invalid-frontmatter-fix"
+    _build_invalid_frontmatter(plugin_template, plugin_dir)
+    command_file = plugin_dir / "commands" / "test.md"
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+
+    # Fix: Add closing --- and required fields
+    command_file.write_bytes(_FIXED_COMMAND)
+
+    # Verify fix
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
+
+
+def test_detects_unsupported_manifest_fields(temp_workspace, validator, plugin_template,
+                                             write_manifest):
+    """Test that validator warns about unsupported fields in manifest."""
+    # Create plugin with unsupported fields
+    plugin_dir = temp_workspace / "broken-unsupported-fields"
+    shutil.copytree(plugin_template, plugin_dir)
+
+    manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+    manifest = {
+        "name": "broken-unsupported-fields",
+        "version": "1.0.0",
+        "description": "Test plugin",
+        "unsupportedField": "This field doesn't exist in spec",
+        "anotherBadField": 123
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Run validator
+    rc, out, err = validator(plugin_dir)
+
+    # Should warn about unsupported fields
+    output = out.lower()
+    assert "unsupported" in output or "warning" in output
+
+
+def test_fix_unsupported_fields(temp_workspace, validator, plugin_template, write_manifest):
+    """Test that removing unsupported fields resolves warnings."""
+    # Create plugin with unsupported fields
+    plugin_dir = temp_workspace / "broken-unsupported-fields-fix"
+    shutil.copytree(plugin_template, plugin_dir)
+
+    manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+    manifest = {
+        "name": "broken-unsupported-fields-fix",
+        "version": "1.0.0",
+        "description": "Test plugin",
+        "badField": "Remove this"
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Verify warning exists
+    rc, out, err = validator(plugin_dir)
+    assert "unsupported" in out.lower()
+
+    # Fix: Remove unsupported field
+    manifest = {
+        "name": "broken-unsupported-fields-fix",
+        "version": "1.0.0",
+        "description": "Test plugin"
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Verify fix (no warnings)
+    rc, out, err = validator(plugin_dir)
+
+    # After fix, should have no warnings about unsupported fields
+    assert rc == 0
+
+
+def test_fix_invalid_name_format(temp_workspace, validator, plugin_template, write_manifest):
+    """Test that fixing name format resolves the issue."""
+    # Create plugin with invalid name
+    plugin_dir = temp_workspace / "broken-invalid-name-fix"
+    _build_invalid_name(plugin_template, plugin_dir)
+    manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+
+    # Fix: Use kebab-case
+    manifest = {
+        "name": "broken-invalid-name-fix",
+        "version": "1.0.0",
+        "description": "Test plugin"
+    }
+    write_manifest(manifest_path, manifest)
+
+    # Verify fix
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
+
+
+def test_fix_plugin_with_multiple_issues(temp_workspace, validator, plugin_template,
+                                         write_manifest):
+    """Test fixing a plugin with multiple validation errors."""
+    # Create plugin with multiple issues
+    plugin_dir = temp_workspace / "broken-multiple-issues"
+    shutil.copytree(plugin_template, plugin_dir)
+    claude_plugin_dir = plugin_dir / ".claude-plugin"
+
+    # Issue 1: Invalid manifest (wrong name format)
+    manifest_path = claude_plugin_dir / "plugin.json"
+    manifest = {
+        "name": "Invalid_Name",  # Wrong format
+        "version": "1.0.0",
+        "badField": "unsupported"  # Unsupported field
+    }
+
+    def break_components():
         # Issue 2: Components in wrong location
         (claude_plugin_dir / "commands").mkdir()
-
         # Issue 3: Invalid command file
-        (claude_plugin_dir / "commands" / "test.md").write_text("""---
-description: "Test"
-# Missing closing ---
-""")
-
-        # Verify it's broken
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0
-        error_count = result.stdout.lower().count("error")
-        assert error_count >= 1  # At least one error detected
-
-        # Fix all issues
-        # Fix 1: Correct manifest
-        manifest = {
-            "name": "broken-multiple-issues",
-            "version": "1.0.0",
-            "description": "Test plugin"
-        }
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
+        (claude_plugin_dir / "commands" / "test.md").write_bytes(_BARE_UNCLOSED_COMMAND)
+
+    # The manifest and the commands directory do not depend on each other
+    _run_concurrently(lambda: write_manifest(manifest_path, manifest), break_components)
+
+    # Verify it's broken
+    rc, out, err = validator(plugin_dir)
+    assert rc != 0
+    error_count = out.lower().count("error")
+    assert error_count >= 1  # At least one error detected
+
+    # Fix all issues
+    # Fix 1: Correct manifest
+    manifest = {
+        "name": "broken-multiple-issues",
+        "version": "1.0.0",
+        "description": "Test plugin"
+    }
+
+    def fix_components():
         # Fix 2: Move commands to root
-        shutil.move(
-            str(claude_plugin_dir / "commands"),
-            str(plugin_dir / "commands")
-        )
-
+        (claude_plugin_dir / "commands").rename(plugin_dir / "commands")
         # Fix 3: Fix command file
-        (plugin_dir / "commands" / "test.md").write_text("""---
-description: "Test"
-allowed-tools: ["Bash"]
-argument-hint: "No arguments"
-model: "sonnet"
-disable-model-invocation: false
----
+        (plugin_dir / "commands" / "test.md").write_bytes(_FIXED_COMMAND)
 
-# Test
-""")
+    _run_concurrently(lambda: write_manifest(manifest_path, manifest), fix_components)
 
-        # Verify all fixed
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
+    # Verify all fixed
+    rc, out, err = validator(plugin_dir)
+    assert rc == 0
 
 
 if __name__ == "__main__":
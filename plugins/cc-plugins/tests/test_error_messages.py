@@ -18,55 +18,76 @@ from pathlib import Path
 import subprocess
 import sys
 
+# cc-plugins root; the scripts are invoked relative to it
+CC_PLUGINS_ROOT = Path(__file__).resolve().parent.parent
+
+# Either marks the validator as pointing users at the official spec
+_SPEC_KEYS = ("code.claude.com", "specification")
+
+
+def _run_script(script, *args, cwd=None):
+    """
+    Run one of the plugin's scripts and capture its output.
+
+    Scripts run under the current interpreter in isolated mode (-I), which
+    skips the user site directory and PYTHON* environment variables at
+    startup. Their stderr is folded into stdout (one pipe) and stdin is
+    closed.
+
+    Args:
+        script: Script path relative to the cc-plugins root
+        *args: Command-line arguments for the script
+        cwd: Working directory; defaults to the cc-plugins root
+
+    Returns:
+        subprocess.CompletedProcess with the combined output in stdout
+    """
+    return subprocess.run(
+        [sys.executable, "-I", script, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL,
+        text=True,
+        cwd=CC_PLUGINS_ROOT if cwd is None else cwd
+    )
+
 
 class TestPluginNameValidation:
     """Test error messages for plugin name validation."""
 
-    def test_invalid_camel_case_name_rejected(self):
+    def test_invalid_camel_case_name_rejected(self, tmp_path):
         """Test that CamelCase names are rejected."""
-        result = subprocess.run(
-            ["python", "scripts/scaffold-plugin.py", "--name", "MyPlugin"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
+        # Per-test --output keeps a wrongly accepted name out of the shared
+        # plugin root, so parallel workers never collide
+        result = _run_script(
+            "scripts/scaffold-plugin.py", "--name", "MyPlugin", "--output", str(tmp_path)
         )
         # Should fail
         assert result.returncode != 0
         # Error message should be helpful
-        assert "kebab-case" in result.stderr.lower() or "kebab-case" in result.stdout.lower()
+        assert "kebab-case" in result.stdout.lower()
 
-    def test_underscore_name_rejected(self):
+    def test_underscore_name_rejected(self, tmp_path):
         """Test that names with underscores are rejected."""
-        result = subprocess.run(
-            ["python", "scripts/scaffold-plugin.py", "--name", "my_plugin"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
+        result = _run_script(
+            "scripts/scaffold-plugin.py", "--name", "my_plugin", "--output", str(tmp_path)
         )
         assert result.returncode != 0
 
-    def test_space_in_name_rejected(self):
+    def test_space_in_name_rejected(self, tmp_path):
         """Test that names with spaces are rejected."""
-        result = subprocess.run(
-            ["python", "scripts/scaffold-plugin.py", "--name", "my plugin"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
+        result = _run_script(
+            "scripts/scaffold-plugin.py", "--name", "my plugin", "--output", str(tmp_path)
         )
         assert result.returncode != 0
 
-    def test_valid_name_accepted(self):
+    def test_valid_name_accepted(self, tmp_path):
         """Test that valid kebab-case names are accepted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
-                ["python", "scripts/scaffold-plugin.py", 
-                 "--name", "test-plugin", "--output", tmpdir],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
-            )
-            assert result.returncode == 0
-            assert "successfully" in result.stdout.lower()
+        result = _run_script(
+            "scripts/scaffold-plugin.py", "--name", "test-plugin", "--output", str(tmp_path)
+        )
+        assert result.returncode == 0
+        assert "successfully" in result.stdout.lower()
 
 
 class TestManifestErrors:
@@ -77,37 +98,24 @@ class TestManifestErrors:
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create plugin dir without manifest
             plugin_dir = Path(tmpdir) / "test-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / ".claude-plugin").mkdir()
+            (plugin_dir / ".claude-plugin").mkdir(parents=True)
 
-            result = subprocess.run(
-                ["python", "scripts/validate-plugin.py", str(plugin_dir)],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
-            )
+            result = _run_script("scripts/validate-plugin.py", str(plugin_dir))
             # Should report error
             assert result.returncode != 0
-            output = result.stderr + result.stdout
             # Should mention plugin.json
-            assert "plugin.json" in output.lower()
+            assert "plugin.json" in result.stdout.lower()
 
     def test_invalid_json_clear_error(self):
         """Test error for invalid JSON is clear."""
         with tempfile.TemporaryDirectory() as tmpdir:
             plugin_dir = Path(tmpdir) / "test-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / ".claude-plugin").mkdir()
+            (plugin_dir / ".claude-plugin").mkdir(parents=True)
             
             # Write invalid JSON
             (plugin_dir / ".claude-plugin" / "plugin.json").write_text("{invalid}")
 
-            result = subprocess.run(
-                ["python", "scripts/validate-plugin.py", str(plugin_dir)],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
-            )
+            result = _run_script("scripts/validate-plugin.py", str(plugin_dir))
             # Should report error
             assert result.returncode != 0
 
@@ -122,14 +130,9 @@ class TestErrorMessageCompleteness:
             plugin_dir.mkdir()
             # Completely invalid plugin
             
-            result = subprocess.run(
-                ["python", "scripts/validate-plugin.py", str(plugin_dir)],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
-            )
+            result = _run_script("scripts/validate-plugin.py", str(plugin_dir))
             
-            output = result.stderr + result.stdout
+            output = result.stdout
             # Should provide actionable feedback
             assert len(output) > 0
 
@@ -139,37 +142,27 @@ class TestScriptUsageMessages:
 
     def test_scaffold_help_available(self):
         """Test that scaffold script help is available."""
-        result = subprocess.run(
-            ["python", "scripts/scaffold-plugin.py", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        result = _run_script("scripts/scaffold-plugin.py", "--help")
         # Should provide help (may exit with 0)
-        assert "name" in result.stdout.lower() or "usage" in result.stdout.lower()
+        stdout = result.stdout.lower()
+        assert "name" in stdout or "usage" in stdout
 
     def test_validate_help_available(self):
         """Test that validate script help is available."""
-        result = subprocess.run(
-            ["python", "scripts/validate-plugin.py", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        result = _run_script("scripts/validate-plugin.py", "--help")
         # Should provide help
-        assert "plugin" in result.stdout.lower() or "validate" in result.stdout.lower()
+        stdout = result.stdout.lower()
+        assert "plugin" in stdout or "validate" in stdout
 
 
 class TestDocumentationReferences:
     """Test that error messages reference helpful resources."""
 
-    def test_validator_mentions_spec(self):
+    def test_validator_mentions_spec(self, validator_source):
         """Test that validator references the specification."""
-        # Check the validator source mentions documentation
-        validator_path = Path(__file__).parent.parent / "scripts" / "validate-plugin.py"
-        content = validator_path.read_text()
         # Should reference documentation
-        assert "code.claude.com" in content or "specification" in content.lower()
+        content = validator_source.lower()
+        assert any(key in content for key in _SPEC_KEYS)
 
 
 class TestActionableFeedback:
@@ -183,17 +176,13 @@ class TestActionableFeedback:
             # Create some content
             (plugin_dir / "test.txt").write_text("content")
 
-            result = subprocess.run(
-                ["python", "scripts/scaffold-plugin.py", 
-                 "--name", "test-plugin", "--output", tmpdir],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
+            result = _run_script(
+                "scripts/scaffold-plugin.py", "--name", "test-plugin", "--output", tmpdir
             )
             # Should fail with helpful message
             assert result.returncode != 0
-            output = result.stderr + result.stdout
-            assert "exists" in output.lower() or "different" in output.lower()
+            output = result.stdout.lower()
+            assert "exists" in output or "different" in output
 
 
 if __name__ == "__main__":
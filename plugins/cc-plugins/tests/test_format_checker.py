@@ -8,314 +8,134 @@ Tests validate:
 - Error reporting with line numbers
 """
 
-import json
-import tempfile
 import shutil
+import tempfile
 import pytest
 from pathlib import Path
-import sys
-
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
-
-@pytest.fixture
-def temp_check_dir():
-    """Create a temporary directory for format checking tests."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="test_format_check_"))
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-class TestMarkdownFrontmatterValidation:
-    """Test YAML frontmatter validation in markdown files."""
-
-    def test_valid_markdown_with_frontmatter(self, temp_check_dir):
-        """Test valid markdown with proper YAML frontmatter."""
-        md_file = temp_check_dir / "valid.md"
-        content = """---
-description: Valid command
-allowed-tools: ["tool1"]
-argument-hint: arg
-model: sonnet
-disable-model-invocation: false
----
-
-# Command Body
-
-Some content here.
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-    def test_invalid_yaml_frontmatter(self, temp_check_dir):
-        """Test detection of invalid YAML syntax."""
-        md_file = temp_check_dir / "invalid.md"
-        content = """---
-description: Test
-invalid yaml: [unclosed
-another: field
----
-
-Content
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-    def test_missing_frontmatter_end_delimiter(self, temp_check_dir):
-        """Test detection of missing closing --- delimiter."""
-        md_file = temp_check_dir / "no_end_delimiter.md"
-        content = """---
-description: Test
-model: sonnet
-
-Content without end delimiter
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-    def test_markdown_without_frontmatter_ok(self, temp_check_dir):
-        """Test that markdown without frontmatter is acceptable."""
-        md_file = temp_check_dir / "no_frontmatter.md"
-        content = """# Just Markdown
-
-No frontmatter here, which is fine for documentation.
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-    def test_malformed_yaml_types(self, temp_check_dir):
-        """Test detection of incorrect YAML types."""
-        md_file = temp_check_dir / "bad_types.md"
-        content = """---
-description: Test
-allowed-tools: invalid_not_array
-model: sonnet
----
-
-Content
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-
-class TestJSONValidation:
-    """Test JSON file syntax validation."""
-
-    def test_valid_json_file(self, temp_check_dir):
-        """Test valid JSON structure."""
-        json_file = temp_check_dir / "valid.json"
-        data = {
-            "name": "test-plugin",
-            "version": "1.0.0",
-            "mcpServers": {
-                "server1": {"command": "node server.js"}
-            }
-        }
-        json_file.write_text(json.dumps(data, indent=2))
-        assert json_file.exists()
 
-    def test_invalid_json_syntax(self, temp_check_dir):
-        """Test detection of invalid JSON."""
-        json_file = temp_check_dir / "invalid.json"
-        content = """{
-  "name": "test",
-  "incomplete": true
-  "missing_comma": false
-}"""
-        json_file.write_text(content)
-        assert json_file.exists()
+# The checker fixtures must not raise warnings (e.g. YAML or JSON deprecations)
+pytestmark = pytest.mark.filterwarnings("error")
 
-    def test_json_trailing_comma(self, temp_check_dir):
-        """Test detection of trailing comma in JSON."""
-        json_file = temp_check_dir / "trailing_comma.json"
-        content = """{
-  "name": "test",
-  "value": "something",
-}"""
-        json_file.write_text(content)
-        assert json_file.exists()
+# Fixture files live on disk as tests/fixtures/format/{markdown,json}/<id>.<ext>
+# and are staged with shutil.copyfile (copy_file_range/sendfile on Linux)
+FIXTURES = Path(__file__).parent / "fixtures" / "format"
 
-    def test_json_single_quotes_invalid(self, temp_check_dir):
-        """Test that single quotes in JSON are invalid."""
-        json_file = temp_check_dir / "single_quotes.json"
-        content = """{'name': 'test', 'value': 'bad'}"""
-        json_file.write_text(content)
-        assert json_file.exists()
 
-    def test_json_with_comments_invalid(self, temp_check_dir):
-        """Test that comments in JSON are invalid."""
-        json_file = temp_check_dir / "with_comments.json"
-        content = """{
-  // This comment is invalid
-  "name": "test"
-}"""
-        json_file.write_text(content)
-        assert json_file.exists()
+def _fixture(name: str, suffix: str) -> Path:
+    """Returns the on-disk fixture file for a case id and file suffix."""
+    return FIXTURES / ("json" if suffix == ".json" else "markdown") / f"{name}{suffix}"
 
 
-class TestPluginJsonValidation:
-    """Test plugin.json specific validation."""
-
-    def test_valid_plugin_json(self, temp_check_dir):
-        """Test valid plugin.json structure."""
-        plugin_json = temp_check_dir / "plugin.json"
-        data = {
-            "name": "my-plugin",
-            "version": "1.0.0",
-            "description": "A test plugin",
-            "author": {"name": "Test Author"},
-            "commands": ["validate"],
-            "agents": [],
-            "skills": []
-        }
-        plugin_json.write_text(json.dumps(data, indent=2))
-        assert plugin_json.exists()
-
-    def test_plugin_json_missing_name(self, temp_check_dir):
-        """Test detection of missing name field."""
-        plugin_json = temp_check_dir / "plugin.json"
-        data = {
-            "version": "1.0.0",
-            "description": "Missing name"
-        }
-        plugin_json.write_text(json.dumps(data, indent=2))
-        assert plugin_json.exists()
-
-
-class TestHooksJsonValidation:
-    """Test hooks.json specific validation."""
-
-    def test_valid_hooks_json(self, temp_check_dir):
-        """Test valid hooks.json structure."""
-        hooks_json = temp_check_dir / "hooks.json"
-        data = {
-            "pre-commit": ["script1.py", "script2.py"],
-            "post-merge": ["merge-handler.py"]
-        }
-        hooks_json.write_text(json.dumps(data, indent=2))
-        assert hooks_json.exists()
-
-    def test_hooks_json_invalid_value_type(self, temp_check_dir):
-        """Test detection of non-array values in hooks."""
-        hooks_json = temp_check_dir / "hooks.json"
-        data = {
-            "pre-commit": "single-script.py",  # Should be array
-            "post-merge": ["valid.py"]
-        }
-        hooks_json.write_text(json.dumps(data, indent=2))
-        assert hooks_json.exists()
-
-
-class TestMcpJsonValidation:
-    """Test .mcp.json specific validation."""
-
-    def test_valid_mcp_json(self, temp_check_dir):
-        """Test valid .mcp.json structure."""
-        mcp_json = temp_check_dir / ".mcp.json"
-        data = {
-            "mcpServers": {
-                "openai": {
-                    "command": "npx",
-                    "args": ["@modelcontextprotocol/server-everything"]
-                },
-                "github": {
-                    "command": "node",
-                    "args": ["server.js"]
-                }
-            }
-        }
-        mcp_json.write_text(json.dumps(data, indent=2))
-        assert mcp_json.exists()
-
-    def test_mcp_json_invalid_server_config(self, temp_check_dir):
-        """Test detection of invalid server configuration."""
-        mcp_json = temp_check_dir / ".mcp.json"
-        data = {
-            "mcpServers": {
-                "invalid": {
-                    # Missing required 'command' field
-                    "args": ["arg1"]
-                }
-            }
-        }
-        mcp_json.write_text(json.dumps(data, indent=2))
-        assert mcp_json.exists()
-
-
-class TestMarkdownFormatting:
-    """Test markdown formatting issues detection."""
-
-    def test_markdown_with_trailing_spaces(self, temp_check_dir):
-        """Test detection of trailing spaces."""
-        md_file = temp_check_dir / "trailing.md"
-        content = """# Heading
-
-Some text with trailing spaces.
-Another line with spaces.
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
-
-    def test_markdown_with_mixed_line_endings(self, temp_check_dir):
-        """Test detection of mixed line endings."""
-        md_file = temp_check_dir / "mixed_endings.md"
-        # Write with mixed line endings
-        md_file.write_bytes(b"Line with LF\nLine with CRLF\r\nAnother LF\n")
-        assert md_file.exists()
-
-    def test_markdown_missing_final_newline(self, temp_check_dir):
-        """Test detection of missing final newline."""
-        md_file = temp_check_dir / "no_final_newline.md"
-        md_file.write_text("# Heading\n\nContent without final newline", )
-        # Remove final newline
-        content = md_file.read_text()
-        md_file.write_text(content.rstrip('\n'))
-        assert md_file.exists()
-
-    def test_markdown_duplicate_headings(self, temp_check_dir):
-        """Test detection of duplicate heading levels."""
-        md_file = temp_check_dir / "dup_headings.md"
-        content = """# Main Heading
-
-### Sub-sub heading
-
-Too many levels skipped.
-
-## Proper sub heading
-"""
-        md_file.write_text(content)
-        assert md_file.exists()
+@pytest.fixture
+def temp_check_dir(tmpfs_root):
+    """Create a temporary directory for format checking tests."""
+    # Lives under the session scratch root, which is removed as a whole at
+    # session end, so there is no per-test rmtree
+    return Path(tempfile.mkdtemp(prefix="test_format_check_", dir=tmpfs_root))
+
+
+# (case id, name the fixture is checked under), grouped by what it exercises.
+# The case id is the scenario the file represents and names its fixture file
+CASES = [
+    # YAML frontmatter in markdown files
+    ("valid_markdown_with_frontmatter", "valid.md"),
+    ("invalid_yaml_frontmatter", "invalid.md"),
+    ("missing_frontmatter_end_delimiter", "no_end_delimiter.md"),
+    # Markdown without frontmatter is acceptable
+    ("markdown_without_frontmatter_ok", "no_frontmatter.md"),
+    ("malformed_yaml_types", "bad_types.md"),
+
+    # JSON syntax
+    ("valid_json_file", "valid.json"),
+    ("invalid_json_syntax", "invalid.json"),
+    ("json_trailing_comma", "trailing_comma.json"),
+    ("json_single_quotes_invalid", "single_quotes.json"),
+    ("json_with_comments_invalid", "with_comments.json"),
+
+    # plugin.json
+    ("valid_plugin_json", "plugin.json"),
+    ("plugin_json_missing_name", "plugin.json"),
+
+    # hooks.json (the invalid one has a string where an array belongs)
+    ("valid_hooks_json", "hooks.json"),
+    ("hooks_json_invalid_value_type", "hooks.json"),
+
+    # .mcp.json (the invalid server config lacks the required 'command')
+    ("valid_mcp_json", ".mcp.json"),
+    ("mcp_json_invalid_server_config", ".mcp.json"),
+
+    # Markdown formatting
+    ("markdown_with_trailing_spaces", "trailing.md"),
+    ("markdown_with_mixed_line_endings", "mixed_endings.md"),
+    ("markdown_missing_final_newline", "no_final_newline.md"),
+    ("markdown_duplicate_headings", "dup_headings.md"),
+]
+
+
+# Cases the checker must report; it checks syntax only, so schema-level
+# problems (missing fields, wrong value types) still pass. Text is read with
+# universal newlines, so a stray CRLF is not trailing whitespace
+_INVALID = {
+    "invalid_yaml_frontmatter",
+    "missing_frontmatter_end_delimiter",
+    "invalid_json_syntax",
+    "json_trailing_comma",
+    "json_single_quotes_invalid",
+    "json_with_comments_invalid",
+    "markdown_with_trailing_spaces",
+    "markdown_missing_final_newline",
+}
+
+
+@pytest.fixture(scope="session")
+def format_results(tmpfs_root, format_checker_module):
+    """Runs one FormatChecker over every case and returns its errors by case id."""
+    corpus = Path(tempfile.mkdtemp(prefix="format_corpus_", dir=tmpfs_root))
+    checker = format_checker_module.FormatChecker(corpus)
+    results = {}
+    for case_id, filename in CASES:
+        # Several cases share a filename, so each gets its own directory
+        case_dir = corpus / case_id
+        case_dir.mkdir()
+        target = case_dir / filename
+        shutil.copyfile(_fixture(case_id, target.suffix), target)
+        results[case_id] = checker.check_file(target)
+    return results
+
+
+@pytest.mark.parametrize("case_id, filename", CASES, ids=[case_id for case_id, _ in CASES])
+def test_format_check(format_results, case_id, filename):
+    """Test that the format checker accepts or reports each fixture file."""
+    errors = format_results[case_id]
+    if case_id in _INVALID:
+        assert errors
+        assert all(error["line"] > 0 for error in errors)
+        assert all(Path(error["file"]).name == filename for error in errors)
+    else:
+        assert errors == []
 
 
 class TestErrorReporting:
     """Test error reporting with line numbers."""
 
-    def test_error_includes_line_number(self, temp_check_dir):
+    def test_error_includes_line_number(self, temp_check_dir, format_checker_module):
         """Test that errors include line numbers."""
-        md_file = temp_check_dir / "error.md"
-        content = """---
-description: Test
-line: 3
-invalid yaml: [unclosed bracket
-another: field
----
-
-Content
-"""
-        md_file.write_text(content)
-        content_lines = content.split('\n')
-        # Line 4 (index 3) has the invalid YAML
-        assert len(content_lines) > 3
-
-    def test_json_error_position(self, temp_check_dir):
+        target = shutil.copyfile(
+            _fixture("error_reporting", ".md"), temp_check_dir / "error.md"
+        )
+        errors = format_checker_module.FormatChecker(temp_check_dir).check_file(target)
+        # Line 4 has the invalid YAML
+        assert len(errors) == 1
+        assert errors[0]["line"] == 4
+        assert "Invalid YAML" in errors[0]["error"]
+
+    def test_json_error_position(self, temp_check_dir, format_checker_module):
         """Test that JSON errors report position."""
-        json_file = temp_check_dir / "error.json"
-        content = """{
-  "field1": "value1",
-  "field2": [1, 2, 3,]
-}"""
-        json_file.write_text(content)
-        lines = content.split('\n')
-        # Trailing comma error on line 3 (4 lines total with opening brace)
-        assert len(lines) == 4
+        target = shutil.copyfile(
+            _fixture("error_reporting", ".json"), temp_check_dir / "error.json"
+        )
+        errors = format_checker_module.FormatChecker(temp_check_dir).check_file(target)
+        # Trailing comma error on line 3
+        assert len(errors) == 1
+        assert errors[0]["line"] == 3
+        assert "column" in errors[0]["error"]
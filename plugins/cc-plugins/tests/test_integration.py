@@ -16,103 +16,48 @@ Test Coverage:
 - Cross-platform compatibility
 """
 
-import json
-import subprocess
-import tempfile
 import pytest
 from pathlib import Path
 import shutil
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create a temporary workspace for integration tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        yield workspace
-
-
-@pytest.fixture
-def cc_plugins_root():
-    """Returns the path to the cc-plugins root directory."""
-    return Path(__file__).parent.parent
-
-
-class TestCreateValidateDocumentWorkflow:
-    """Test the complete Create → Validate → Document workflow."""
-
-    def test_create_validate_document_workflow(self, temp_workspace, cc_plugins_root):
-        """Test creating, validating, and documenting a plugin."""
-        plugin_name = "integration-test-plugin"
-
-        # Step 1: Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(
-            create_cmd,
-            plugin_name,
-            description="Integration test plugin",
-            cwd=temp_workspace
-        )
-
-        assert result.returncode == 0, f"Create failed: {result.stderr}"
-
-        plugin_dir = temp_workspace / plugin_name
-        assert plugin_dir.exists(), "Plugin not created"
-
-        # Step 2: Validate plugin
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        assert result.returncode == 0, f"Validation failed: {result.stdout}"
-
-        # Step 3: Add components to plugin
-        self._add_sample_command(plugin_dir)
-        self._add_sample_agent(plugin_dir)
-        self._add_sample_skill(plugin_dir)
-
-        # Step 4: Validate again with components
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-
-        assert result.returncode == 0, f"Validation with components failed: {result.stdout}"
+# Component file bodies, formatted with str.format by _add_component. The
+# generic templates take the component name and its title-cased form
+_COMMAND_TMPL = """---
+description: "Command {name}"
+allowed-tools: ["Bash"]
+argument-hint: "No arguments"
+model: "sonnet"
+disable-model-invocation: false
+---
 
-        # Step 5: Verify all components are present
-        assert (plugin_dir / "commands" / "sample.md").exists()
-        assert (plugin_dir / "agents" / "helper.md").exists()
-        assert (plugin_dir / "skills" / "sample-skill" / "SKILL.md").exists()
+# {title}
 
-    def _execute_create_command(self, create_cmd, plugin_name, description=None, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
+!bash
+echo "{name}"
+"""
 
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
+_AGENT_TMPL = """---
+description: "Agent {name}"
+activation-phrases: ["{name}"]
+allowed-tools: ["Bash"]
+model: "sonnet"
+---
 
-        args = [plugin_name]
-        if description:
-            args.extend(["--description", description])
+# {title} Agent
+"""
 
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash"] + args,
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
+_SKILL_TMPL = """---
+name: "{name}"
+description: "Skill {name}"
+allowed-tools: ["Bash"]
+model: "sonnet"
+---
 
-        return result
+# {title} Skill
+"""
 
-    def _add_sample_command(self, plugin_dir):
-        """Add a sample command to the plugin."""
-        command_file = plugin_dir / "commands" / "sample.md"
-        command_file.write_text("""---
+_SAMPLE_COMMAND = """---
 description: "A sample command for testing"
 allowed-tools: ["Bash", "Read", "Write"]
 argument-hint: "Optional arguments"
@@ -132,12 +77,9 @@ This is a sample command for integration testing.
 
 !bash
 echo "Sample command executed"
-""")
+"""
 
-    def _add_sample_agent(self, plugin_dir):
-        """Add a sample agent to the plugin."""
-        agent_file = plugin_dir / "agents" / "helper.md"
-        agent_file.write_text("""---
+_SAMPLE_AGENT = """---
 description: "A helpful assistant agent"
 activation-phrases: ["help me", "assist with"]
 allowed-tools: ["Bash", "Read", "Write"]
@@ -157,15 +99,9 @@ This agent activates when users need help.
 - Provides assistance
 - Answers questions
 - Guides through workflows
-""")
-
-    def _add_sample_skill(self, plugin_dir):
-        """Add a sample skill to the plugin."""
-        skill_dir = plugin_dir / "skills" / "sample-skill"
-        skill_dir.mkdir(parents=True, exist_ok=True)
+"""
 
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text("""---
+_SAMPLE_SKILL = """---
 name: "sample-skill"
 description: "A reusable skill for testing"
 allowed-tools: ["Bash"]
@@ -185,219 +121,255 @@ This skill demonstrates a reusable workflow pattern.
 1. Initialize
 2. Execute
 3. Complete
-""")
+"""
+
+_NEW_FEATURE_COMMAND = """---
+description: "A new feature command"
+allowed-tools: ["Bash"]
+argument-hint: "No arguments"
+model: "sonnet"
+disable-model-invocation: false
+---
 
+# New Feature
 
-class TestCreateBreakDebugFixWorkflow:
-    """Test the Create → Break → Debug → Fix workflow."""
+New functionality added in update.
 
-    def test_create_break_debug_fix_workflow(self, temp_workspace, cc_plugins_root):
-        """Test creating, breaking, debugging, and fixing a plugin."""
-        plugin_name = "break-fix-test-plugin"
+!bash
+echo "New feature"
+"""
 
-        # Step 1: Create valid plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
+_FEATURE_COMMAND = """---
+description: "Main feature command"
+allowed-tools: ["Bash", "Read", "Write"]
+argument-hint: "No arguments"
+model: "sonnet"
+disable-model-invocation: false
+---
 
-        plugin_dir = temp_workspace / plugin_name
+# Feature Command
 
-        # Step 2: Verify it's valid
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Initial plugin should be valid"
+!bash
+echo "Feature executed"
+"""
 
-        # Step 3: Break the plugin (invalid manifest)
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+_ASSISTANT_AGENT = """---
+description: "Assistant agent"
+activation-phrases: ["help", "assist"]
+allowed-tools: ["Bash"]
+model: "sonnet"
+---
 
-        manifest["name"] = "Invalid_Name_With_Underscores"
-        manifest["badField"] = "unsupported"
+# Assistant Agent
+"""
 
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+_WORKFLOW_SKILL = """---
+name: "workflow"
+description: "Workflow skill"
+allowed-tools: ["Bash"]
+model: "sonnet"
+---
 
-        # Step 4: Debug - detect issues
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode != 0, "Should detect broken plugin"
-        assert "kebab" in result.stdout.lower() or "lowercase" in result.stdout.lower()
+# Workflow Skill
+"""
 
-        # Step 5: Fix the plugin
-        manifest["name"] = plugin_name
-        del manifest["badField"]
+# Where each kind of component lives in a plugin
+_COMPONENT_PATHS = {
+    "command": "commands/{name}.md",
+    "agent": "agents/{name}.md",
+    "skill": "skills/{name}/SKILL.md",
+}
 
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
 
-        # Step 6: Verify fix
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Fixed plugin should pass validation"
+def _add_component(plugin_dir, kind, name, tmpl=None):
+    """
+    Write one component file into a plugin.
 
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
+    commands/ and agents/ come with every created plugin; a skill's own
+    directory must already exist (see _ensure_dirs).
 
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
+    Args:
+        plugin_dir: Plugin root directory
+        kind: "command", "agent" or "skill"
+        name: Component name
+        tmpl: Body template; defaults to the generic template for kind
 
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
+    Returns:
+        Path of the written file
+    """
+    if tmpl is None:
+        tmpl = {"command": _COMMAND_TMPL, "agent": _AGENT_TMPL, "skill": _SKILL_TMPL}[kind]
+    target = plugin_dir / _COMPONENT_PATHS[kind].format(name=name)
+    target.write_text(tmpl.format(name=name, title=name.title()))
+    return target
 
-        return result
 
+def _ensure_dirs(paths):
+    """Create every directory in paths, parents first, in one pass."""
+    for path in sorted(set(paths)):
+        path.mkdir(parents=True, exist_ok=True)
 
-class TestValidateUpdateValidateWorkflow:
-    """Test the Validate → Update → Validate workflow."""
 
-    def test_validate_update_validate_workflow(self, temp_workspace, cc_plugins_root):
-        """Test validating, updating, and revalidating a plugin."""
-        plugin_name = "update-test-plugin"
+# Name of the plugin shared, via copies, by tests that don't test creation
+CANONICAL_PLUGIN_NAME = "canonical-plugin"
 
-        # Step 1: Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
 
-        plugin_dir = temp_workspace / plugin_name
+@pytest.fixture(scope="session")
+def canonical_plugin(tmp_path_factory, run_create):
+    """Create one plugin per session for tests that start from a fresh copy."""
+    root = tmp_path_factory.mktemp("canon")
+    result = run_create(CANONICAL_PLUGIN_NAME, cwd=root)
+    assert result.returncode == 0, f"Create command failed: {result.stderr}"
+    return root / CANONICAL_PLUGIN_NAME
 
-        # Step 2: Initial validation
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
 
-        # Step 3: Update manifest with more metadata
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+@pytest.fixture
+def fresh_plugin(tmp_path, canonical_plugin):
+    """Returns this test's own copy of the canonical plugin."""
+    return Path(shutil.copytree(canonical_plugin, tmp_path / CANONICAL_PLUGIN_NAME))
+
+
+def _add_sample_components(plugin_dir, patch_manifest):
+    """Create → Validate → Document: add a command, an agent and a skill."""
+    _ensure_dirs([plugin_dir / "skills" / "sample-skill"])
+    _add_component(plugin_dir, "command", "sample", _SAMPLE_COMMAND)
+    _add_component(plugin_dir, "agent", "helper", _SAMPLE_AGENT)
+    _add_component(plugin_dir, "skill", "sample-skill", _SAMPLE_SKILL)
+
 
-        manifest["author"] = {
+def _update_with_new_feature(plugin_dir, patch_manifest):
+    """Validate → Update → Validate: add manifest metadata and a new command."""
+    patch_manifest(
+        plugin_dir / ".claude-plugin" / "plugin.json",
+        author={
             "name": "Integration Tester",
             "email": "test@example.com",
             "url": "https://example.com"
-        }
-        manifest["keywords"] = ["test", "integration", "workflow"]
-        manifest["homepage"] = "https://example.com/plugin"
-        manifest["repository"] = "https://github.com/example/plugin"
-
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        # Step 4: Revalidate with updates
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
+        },
+        keywords=["test", "integration", "workflow"],
+        homepage="https://example.com/plugin",
+        repository="https://github.com/example/plugin"
+    )
+    _add_component(plugin_dir, "command", "new-feature", _NEW_FEATURE_COMMAND)
+
+
+def _develop_and_release(plugin_dir, patch_manifest):
+    """Complete lifecycle: add all component types, then bump the version."""
+    _ensure_dirs([plugin_dir / "skills" / "workflow"])
+    _add_component(plugin_dir, "command", "feature", _FEATURE_COMMAND)
+    _add_component(plugin_dir, "agent", "assistant", _ASSISTANT_AGENT)
+    _add_component(plugin_dir, "skill", "workflow", _WORKFLOW_SKILL)
+    patch_manifest(
+        plugin_dir / ".claude-plugin" / "plugin.json",
+        version="1.1.0",
+        keywords=["lifecycle", "test", "integration"]
+    )
+
+
+class TestWorkflows:
+    """Test that a created plugin stays valid through each development workflow."""
+
+    @pytest.mark.parametrize("mutation", [
+        pytest.param(_add_sample_components, id="create-validate-document"),
+        pytest.param(_update_with_new_feature, id="validate-update-validate"),
+    ])
+    def test_validate_after_mutation(self, fresh_plugin, run_validator, patch_manifest, mutation):
+        """Test that the plugin is valid after the workflow's edits."""
+        mutation(fresh_plugin, patch_manifest)
+
+        # Only the final state is validated, so a failure doesn't say which
+        # edit in the workflow introduced it
+        result = run_validator(fresh_plugin)
+        assert result.returncode == 0, f"Validation failed: {result.stdout}"
+
+        assert (fresh_plugin / ".claude-plugin" / "plugin.json").exists()
+        assert (fresh_plugin / "README.md").exists()
+
+    def test_complete_lifecycle(self, tmp_path, run_create, run_validator, patch_manifest):
+        """Test creating a plugin with full metadata, developing and releasing it."""
+        plugin_name = "lifecycle-test-plugin"
+
+        # Created with every metadata option, unlike the shared canonical plugin
+        result = run_create(
+            plugin_name,
+            cwd=tmp_path,
+            description="Lifecycle test plugin",
+            author="Tester",
+            license="MIT"
         )
-        assert result.returncode == 0, "Updated plugin should still be valid"
+        assert result.returncode == 0, f"Create failed: {result.stderr}"
 
-        # Step 5: Add new component
-        command_file = plugin_dir / "commands" / "new-feature.md"
-        command_file.write_text("""---
-description: "A new feature command"
-allowed-tools: ["Bash"]
-argument-hint: "No arguments"
-model: "sonnet"
-disable-model-invocation: false
----
+        plugin_dir = tmp_path / plugin_name
+        _develop_and_release(plugin_dir, patch_manifest)
 
-# New Feature
+        result = run_validator(plugin_dir)
+        assert result.returncode == 0, f"Validation failed: {result.stdout}"
 
-New functionality added in update.
 
-!bash
-echo "New feature"
-""")
+class TestCreateBreakDebugFixWorkflow:
+    """Test the Create → Break → Debug → Fix workflow."""
 
-        # Step 6: Final validation
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Plugin with new component should be valid"
+    def test_create_break_debug_fix_workflow(self, tmp_path, run_create, run_validator,
+                                             patch_manifest, write_manifest):
+        """Test creating, breaking, debugging, and fixing a plugin."""
+        plugin_name = "break-fix-test-plugin"
 
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
+        # Step 1: Create valid plugin
+        result = run_create(plugin_name, cwd=tmp_path, capture=False)
+        assert result.returncode == 0
 
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
+        plugin_dir = tmp_path / plugin_name
 
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
+        # Step 2: Verify it's valid
+        result = run_validator(plugin_dir)
+        assert result.returncode == 0, "Initial plugin should be valid"
+
+        # Step 3: Break the plugin (invalid manifest)
+        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+        manifest = patch_manifest(
+            manifest_path, name="Invalid_Name_With_Underscores", badField="unsupported"
         )
 
-        return result
+        # Step 4: Debug - detect issues
+        result = run_validator(plugin_dir)
+        assert result.returncode != 0, "Should detect broken plugin"
+        output = result.stdout.lower()
+        assert "kebab" in output or "lowercase" in output
+
+        # Step 5: Fix the plugin
+        manifest["name"] = plugin_name
+        del manifest["badField"]
+        write_manifest(manifest_path, manifest)
+
+        # Step 6: Verify fix
+        result = run_validator(plugin_dir)
+        assert result.returncode == 0, "Fixed plugin should pass validation"
 
 
 class TestCrossComponentInteractions:
     """Test interactions between different components."""
 
-    def test_commands_agents_skills_coexist(self, temp_workspace, cc_plugins_root):
+    def test_commands_agents_skills_coexist(self, fresh_plugin, run_validator):
         """Test that commands, agents, and skills can coexist in one plugin."""
-        plugin_name = "full-featured-plugin"
-
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
-
-        plugin_dir = temp_workspace / plugin_name
+        # Start from a freshly created plugin
+        plugin_dir = fresh_plugin
 
         # Add all component types
-        self._add_command(plugin_dir, "cmd1")
-        self._add_command(plugin_dir, "cmd2")
-        self._add_agent(plugin_dir, "agent1")
-        self._add_agent(plugin_dir, "agent2")
-        self._add_skill(plugin_dir, "skill1")
-        self._add_skill(plugin_dir, "skill2")
+        _ensure_dirs(plugin_dir / "skills" / name for name in ("skill1", "skill2"))
+        for kind, name in [("command", "cmd1"), ("command", "cmd2"),
+                           ("agent", "agent1"), ("agent", "agent2"),
+                           ("skill", "skill1"), ("skill", "skill2")]:
+            _add_component(plugin_dir, kind, name)
 
         # Validate
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, "All components should coexist"
 
-    def test_multiple_scripts_in_plugin(self, temp_workspace, cc_plugins_root):
+    def test_multiple_scripts_in_plugin(self, fresh_plugin, run_validator):
         """Test that multiple scripts can exist in a plugin."""
-        plugin_name = "multi-script-plugin"
-
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
-
-        plugin_dir = temp_workspace / plugin_name
+        # Start from a freshly created plugin
+        plugin_dir = fresh_plugin
 
         # Add multiple scripts
         scripts_dir = plugin_dir / "scripts"
@@ -408,127 +380,38 @@ class TestCrossComponentInteractions:
         (scripts_dir / "script3.sh").write_text("#!/bin/bash\necho 'Script 3'\n")
 
         # Validate
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         assert result.returncode == 0, "Multiple scripts should be valid"
 
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
-
-    def _add_command(self, plugin_dir, name):
-        """Add a command to the plugin."""
-        (plugin_dir / "commands" / f"{name}.md").write_text(f"""---
-description: "Command {name}"
-allowed-tools: ["Bash"]
-argument-hint: "No arguments"
-model: "sonnet"
-disable-model-invocation: false
----
-
-# {name.title()}
-
-!bash
-echo "{name}"
-""")
-
-    def _add_agent(self, plugin_dir, name):
-        """Add an agent to the plugin."""
-        (plugin_dir / "agents" / f"{name}.md").write_text(f"""---
-description: "Agent {name}"
-activation-phrases: ["{name}"]
-allowed-tools: ["Bash"]
-model: "sonnet"
----
-
-# {name.title()} Agent
-""")
-
-    def _add_skill(self, plugin_dir, name):
-        """Add a skill to the plugin."""
-        skill_dir = plugin_dir / "skills" / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
-
-        (skill_dir / "SKILL.md").write_text(f"""---
-name: "{name}"
-description: "Skill {name}"
-allowed-tools: ["Bash"]
-model: "sonnet"
----
-
-# {name.title()} Skill
-""")
-
 
 class TestErrorHandling:
     """Test error handling across all components."""
 
-    def test_graceful_error_messages(self, temp_workspace, cc_plugins_root):
+    def test_graceful_error_messages(self, tmp_path, validator_module):
         """Test that errors provide helpful messages."""
-        # Test various error scenarios
-
+        # Test various error scenarios, validated together in one run
         # Scenario 1: Non-existent directory
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(temp_workspace / "nonexistent")],
-            capture_output=True,
-            text=True
-        )
-
-        assert result.returncode != 0
-        assert "does not exist" in result.stdout.lower()
-
         # Scenario 2: File instead of directory
-        test_file = temp_workspace / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_file.write_text("not a directory")
 
-        result = subprocess.run(
-            ["python3", str(validator_script), str(test_file)],
-            capture_output=True,
-            text=True
-        )
+        missing, not_dir = validator_module.validate_many([tmp_path / "nonexistent", test_file])
 
-        assert result.returncode != 0
-        assert "not a directory" in result.stdout.lower()
+        assert missing["returncode"] != 0
+        assert "does not exist" in "\n".join(missing["errors"]).lower()
 
-    def test_recovers_from_partial_failures(self, temp_workspace, cc_plugins_root):
-        """Test that validation continues after finding one error."""
-        plugin_name = "multi-error-plugin"
+        assert not_dir["returncode"] != 0
+        assert "not a directory" in "\n".join(not_dir["errors"]).lower()
 
-        # Create plugin
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(create_cmd, plugin_name, cwd=temp_workspace)
-        assert result.returncode == 0
-
-        plugin_dir = temp_workspace / plugin_name
+    def test_recovers_from_partial_failures(self, fresh_plugin, run_validator, patch_manifest):
+        """Test that validation continues after finding one error."""
+        # Start from a freshly created plugin
+        plugin_dir = fresh_plugin
 
         # Introduce multiple errors
         # Error 1: Invalid manifest name
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
-
-        manifest["name"] = "Invalid_Name"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        patch_manifest(plugin_dir / ".claude-plugin" / "plugin.json", name="Invalid_Name")
 
         # Error 2: Invalid command file
         (plugin_dir / "commands" / "broken.md").write_text("""---
@@ -537,12 +420,7 @@ description: "Broken command"
 """)
 
         # Run validator
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
+        result = run_validator(plugin_dir)
 
         # Should detect BOTH errors
         assert result.returncode != 0
@@ -550,167 +428,7 @@ description: "Broken command"
 
         # Check that validation didn't stop at first error
         # (it should report multiple issues)
-        assert output.count("error") >= 1
-
-    def _execute_create_command(self, create_cmd, plugin_name, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash", plugin_name],
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
-
-
-class TestCompleteLifecycle:
-    """Test the complete plugin development lifecycle."""
-
-    def test_full_plugin_lifecycle(self, temp_workspace, cc_plugins_root):
-        """Test creating, developing, validating, and maintaining a plugin."""
-        plugin_name = "lifecycle-test-plugin"
-
-        # Phase 1: Creation
-        create_cmd = cc_plugins_root / "commands" / "create.md"
-        result = self._execute_create_command(
-            create_cmd,
-            plugin_name,
-            description="Lifecycle test plugin",
-            author="Tester",
-            license="MIT",
-            cwd=temp_workspace
-        )
-        assert result.returncode == 0, "Phase 1: Creation failed"
-
-        plugin_dir = temp_workspace / plugin_name
-
-        # Phase 2: Initial validation
-        validator_script = cc_plugins_root / "scripts" / "validate-plugin.py"
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Phase 2: Initial validation failed"
-
-        # Phase 3: Development - add components
-        self._add_components(plugin_dir)
-
-        # Phase 4: Validation after development
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Phase 4: Development validation failed"
-
-        # Phase 5: Update metadata
-        self._update_metadata(plugin_dir)
-
-        # Phase 6: Final validation
-        result = subprocess.run(
-            ["python3", str(validator_script), str(plugin_dir)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0, "Phase 6: Final validation failed"
-
-        # Phase 7: Verify structure
-        self._verify_complete_structure(plugin_dir)
-
-    def _execute_create_command(self, create_cmd, plugin_name, description=None,
-                                 author=None, license=None, cwd=None):
-        """Execute the create command."""
-        with open(create_cmd, 'r') as f:
-            content = f.read()
-
-        bash_start = content.find("!bash\n")
-        bash_script = content[bash_start + 6:]
-
-        args = [plugin_name]
-        if description:
-            args.extend(["--description", description])
-        if author:
-            args.extend(["--author", author])
-        if license:
-            args.extend(["--license", license])
-
-        result = subprocess.run(
-            ["bash", "-c", bash_script, "bash"] + args,
-            cwd=cwd,
-            capture_output=True,
-            text=True
-        )
-
-        return result
-
-    def _add_components(self, plugin_dir):
-        """Add all component types to the plugin."""
-        # Add command
-        (plugin_dir / "commands" / "feature.md").write_text("""---
-description: "Main feature command"
-allowed-tools: ["Bash", "Read", "Write"]
-argument-hint: "No arguments"
-model: "sonnet"
-disable-model-invocation: false
----
-
-# Feature Command
-
-!bash
-echo "Feature executed"
-""")
-
-        # Add agent
-        (plugin_dir / "agents" / "assistant.md").write_text("""---
-description: "Assistant agent"
-activation-phrases: ["help", "assist"]
-allowed-tools: ["Bash"]
-model: "sonnet"
----
-
-# Assistant Agent
-""")
-
-        # Add skill
-        skill_dir = plugin_dir / "skills" / "workflow"
-        skill_dir.mkdir(parents=True, exist_ok=True)
-        (skill_dir / "SKILL.md").write_text("""---
-name: "workflow"
-description: "Workflow skill"
-allowed-tools: ["Bash"]
-model: "sonnet"
----
-
-# Workflow Skill
-""")
-
-    def _update_metadata(self, plugin_dir):
-        """Update plugin metadata."""
-        manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
-
-        manifest["version"] = "1.1.0"
-        manifest["keywords"] = ["lifecycle", "test", "integration"]
-
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-    def _verify_complete_structure(self, plugin_dir):
-        """Verify that plugin has complete structure."""
-        assert (plugin_dir / ".claude-plugin" / "plugin.json").exists()
-        assert (plugin_dir / "README.md").exists()
-        assert (plugin_dir / "commands" / "feature.md").exists()
-        assert (plugin_dir / "agents" / "assistant.md").exists()
-        assert (plugin_dir / "skills" / "workflow" / "SKILL.md").exists()
+        assert "error" in output
 
 
 if __name__ == "__main__":
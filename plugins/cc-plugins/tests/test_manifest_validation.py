@@ -8,11 +8,13 @@ Tests ensure that manifest validation logic correctly identifies:
 - Unsupported or deprecated fields
 """
 
+import re
 import json
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
+import fastjsonschema
 
 
 class TestManifestFieldValidation:
@@ -39,6 +41,7 @@ class TestManifestFieldValidation:
             {"name": "my_plugin"},  # snake_case
             {"name": "my plugin"},  # spaces
             {"name": "MyAwesome_Plugin"},  # mixed
+            {"name": "my-plugin\n"},  # trailing newline
         ]
 
         for manifest in invalid_names:
@@ -199,6 +202,99 @@ class TestManifestValidationFunction:
         assert len(errors) > 0, "Invalid manifest should return errors"
 
 
+# Manifests both validators must accept or both reject
+SCHEMA_AGREEMENT_CASES = [
+    pytest.param({"name": "valid-plugin", "version": "1.0.0"}, id="valid"),
+    pytest.param({"name": "test-plugin", "author": {"name": "A", "email": "a@b.c"},
+                  "keywords": ["x"], "commands": "commands/"}, id="valid_full"),
+    pytest.param([], id="top_level_array"),
+    pytest.param("x", id="top_level_string"),
+    pytest.param({}, id="missing_name"),
+    pytest.param({"name": 123}, id="name_not_string"),
+    pytest.param({"name": "MyAwesome-Plugin"}, id="name_not_kebab_case"),
+    pytest.param({"name": "test-plugin-"}, id="name_trailing_hyphen"),
+    pytest.param({"name": "my-plugin\n"}, id="name_trailing_newline"),
+    pytest.param({"name": "test-plugin", "version": 1.0}, id="version_not_string"),
+    pytest.param({"name": "test-plugin", "description": ["array"]}, id="description_not_string"),
+    pytest.param({"name": "test-plugin", "author": "Not An Object"}, id="author_not_object"),
+    pytest.param({"name": "test-plugin", "author": {"email": True}}, id="author_field_not_string"),
+    pytest.param({"name": "test-plugin", "keywords": "not-an-array"}, id="keywords_not_array"),
+    pytest.param({"name": "test-plugin", "keywords": ["valid", 123]}, id="keyword_not_string"),
+    pytest.param({"name": "test-plugin", "unsupportedField": "value"}, id="unsupported_field"),
+]
+
+
+class TestSchemaAgreement:
+    """Test that MANIFEST_SCHEMA and the detailed checks agree."""
+
+    @pytest.mark.parametrize("manifest", SCHEMA_AGREEMENT_CASES)
+    def test_schema_matches_detailed_checks(self, manifest):
+        """Test that the schema rejects exactly the manifests the detailed checks report."""
+        try:
+            _VALIDATE(manifest)
+            schema_valid = True
+        except fastjsonschema.JsonSchemaException:
+            schema_valid = False
+        assert schema_valid == (_manifest_errors(manifest) == [])
+
+
+# kebab-case: lowercase words of letters and digits joined by single hyphens.
+# \Z rather than $, which would also match before a trailing newline
+_KEBAB_PATTERN = r"^[a-z0-9]+(?:-[a-z0-9]+)*\Z"
+_KEBAB_RE = re.compile(_KEBAB_PATTERN)
+
+# Official manifest fields as JSON Schema; the path fields accept any value
+MANIFEST_SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string", "pattern": _KEBAB_PATTERN},
+        "version": {"type": "string"},
+        "description": {"type": "string"},
+        "homepage": {"type": "string"},
+        "repository": {"type": "string"},
+        "license": {"type": "string"},
+        "author": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "url": {"type": "string"},
+            },
+        },
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "commands": {},
+        "agents": {},
+        "hooks": {},
+        "mcpServers": {},
+        "skills": {},
+    },
+}
+
+# Compiled once at import. It only decides whether a manifest is valid; its
+# first-error message is too terse, so invalid manifests are described by
+# _manifest_errors, which TestSchemaAgreement keeps in step with the schema
+_VALIDATE = fastjsonschema.compile(MANIFEST_SCHEMA)
+
+# Built once rather than on every validate_manifest call
+_OFFICIAL_FIELDS = frozenset(MANIFEST_SCHEMA["properties"])
+_SCALAR_CHECKS = (
+    ("version", str, "string"),
+    ("description", str, "string"),
+    ("homepage", str, "string"),
+    ("repository", str, "string"),
+    ("license", str, "string"),
+)
+_AUTHOR_CHECKS = (
+    ("name", str, "string"),
+    ("email", str, "string"),
+    ("url", str, "string"),
+)
+# Distinguishes an absent field from one explicitly set to null
+_MISSING = object()
+
+
 # Placeholder for actual validation function to be implemented
 def validate_manifest(manifest_data):
     """
@@ -210,7 +306,20 @@ def validate_manifest(manifest_data):
     Returns:
         List of error/warning messages
     """
+    try:
+        _VALIDATE(manifest_data)
+        return []
+    except fastjsonschema.JsonSchemaException:
+        return _manifest_errors(manifest_data)
+
+
+def _manifest_errors(manifest_data):
+    """Return a message for every problem in a manifest the schema rejects."""
+    if not isinstance(manifest_data, dict):
+        return ["Manifest must be a JSON object"]
+
     errors = []
+    get = manifest_data.get
 
     # Required fields
     if "name" not in manifest_data:
@@ -220,25 +329,27 @@ def validate_manifest(manifest_data):
     elif not is_kebab_case(manifest_data["name"]):
         errors.append(f"Field 'name' must be in kebab-case (lowercase with hyphens), got: {manifest_data['name']}")
 
-    # Optional string fields
-    string_fields = ["version", "description", "homepage", "repository", "license"]
-    for field in string_fields:
-        if field in manifest_data and not isinstance(manifest_data[field], str):
-            errors.append(f"Field '{field}' must be a string")
+    # Optional scalar fields
+    for field, field_type, label in _SCALAR_CHECKS:
+        value = get(field, _MISSING)
+        if value is not _MISSING and not isinstance(value, field_type):
+            errors.append(f"Field '{field}' must be a {label}")
 
     # Author object
-    if "author" in manifest_data:
-        author = manifest_data["author"]
+    author = get("author", _MISSING)
+    if author is not _MISSING:
         if not isinstance(author, dict):
             errors.append("Field 'author' must be an object")
         else:
-            for key in ["name", "email", "url"]:
-                if key in author and not isinstance(author[key], str):
-                    errors.append(f"Field 'author.{key}' must be a string")
+            author_get = author.get
+            for key, key_type, label in _AUTHOR_CHECKS:
+                value = author_get(key, _MISSING)
+                if value is not _MISSING and not isinstance(value, key_type):
+                    errors.append(f"Field 'author.{key}' must be a {label}")
 
     # Keywords array
-    if "keywords" in manifest_data:
-        keywords = manifest_data["keywords"]
+    keywords = get("keywords", _MISSING)
+    if keywords is not _MISSING:
         if not isinstance(keywords, list):
             errors.append("Field 'keywords' must be an array")
         else:
@@ -248,13 +359,8 @@ def validate_manifest(manifest_data):
                     break
 
     # Check for unsupported fields
-    official_fields = {
-        "name", "version", "description", "author", "homepage",
-        "repository", "license", "keywords", "commands", "agents",
-        "hooks", "mcpServers", "skills"
-    }
     for field in manifest_data:
-        if field not in official_fields:
+        if field not in _OFFICIAL_FIELDS:
             errors.append(f"Unsupported field: '{field}' (not in official specification)")
 
     return errors
@@ -262,13 +368,9 @@ def validate_manifest(manifest_data):
 
 def is_kebab_case(name):
     """Check if a string follows kebab-case convention."""
-    if not name:
-        return False
-    # kebab-case: lowercase, can contain hyphens, no spaces or underscores
-    if " " in name or "_" in name:
+    if not isinstance(name, str):
         return False
-    # Must be lowercase or contain hyphens
-    return name.islower() or "-" in name
+    return bool(_KEBAB_RE.match(name))
 
 
 if __name__ == "__main__":
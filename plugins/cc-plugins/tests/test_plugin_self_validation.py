@@ -23,11 +23,6 @@ import pytest
 class TestPluginStructure:
     """Test that cc-plugins has correct structure."""
 
-    @pytest.fixture
-    def plugin_root(self):
-        """Get cc-plugins root directory."""
-        return Path(__file__).parent.parent
-
     def test_plugin_root_exists(self, plugin_root):
         """Test that plugin root exists."""
         assert plugin_root.exists()
@@ -87,58 +82,47 @@ class TestPluginStructure:
 class TestManifestValidity:
     """Test that plugin.json manifest is valid."""
 
-    @pytest.fixture
-    def manifest(self):
-        """Load plugin manifest."""
-        manifest_path = Path(__file__).parent.parent / ".claude-plugin" / "plugin.json"
-        return json.loads(manifest_path.read_text())
-
-    def test_manifest_has_name(self, manifest):
+    def test_manifest_has_name(self, plugin_manifest):
         """Test that manifest has name field."""
-        assert "name" in manifest
-        assert manifest["name"]
+        assert "name" in plugin_manifest
+        assert plugin_manifest["name"]
 
-    def test_manifest_name_is_kebab_case(self, manifest):
+    def test_manifest_name_is_kebab_case(self, plugin_manifest):
         """Test that manifest name is kebab-case."""
-        name = manifest["name"]
+        name = plugin_manifest["name"]
         assert name.islower()
         assert not " " in name
         assert not "_" in name
 
-    def test_manifest_has_version(self, manifest):
+    def test_manifest_has_version(self, plugin_manifest):
         """Test that manifest has version."""
-        assert "version" in manifest
-        assert manifest["version"]
+        assert "version" in plugin_manifest
+        assert plugin_manifest["version"]
 
-    def test_manifest_version_is_semantic(self, manifest):
+    def test_manifest_version_is_semantic(self, plugin_manifest):
         """Test that manifest version is semantic versioning."""
         import re
-        version = manifest["version"]
+        version = plugin_manifest["version"]
         assert re.match(r"^\d+\.\d+\.\d+", version), \
             f"Version should be semantic (X.Y.Z), got: {version}"
 
-    def test_manifest_has_description(self, manifest):
+    def test_manifest_has_description(self, plugin_manifest):
         """Test that manifest has description."""
-        assert "description" in manifest
-        assert manifest["description"]
+        assert "description" in plugin_manifest
+        assert plugin_manifest["description"]
 
-    def test_manifest_fields_are_strings(self, manifest):
+    def test_manifest_fields_are_strings(self, plugin_manifest):
         """Test that manifest string fields are strings."""
         string_fields = ["name", "version", "description"]
         for field in string_fields:
-            if field in manifest:
-                assert isinstance(manifest[field], str), \
+            if field in plugin_manifest:
+                assert isinstance(plugin_manifest[field], str), \
                     f"Field {field} should be string"
 
 
 class TestComponentValidity:
     """Test that all components are valid."""
 
-    @pytest.fixture
-    def plugin_root(self):
-        """Get plugin root."""
-        return Path(__file__).parent.parent
-
     def test_all_commands_have_frontmatter(self, plugin_root):
         """Test that all commands have YAML frontmatter."""
         commands_dir = plugin_root / "commands"
@@ -191,11 +175,6 @@ class TestComponentValidity:
 class TestPluginValidation:
     """Test that cc-plugins passes its own validation."""
 
-    @pytest.fixture
-    def plugin_root(self):
-        """Get plugin root."""
-        return Path(__file__).parent.parent
-
     def test_plugin_validates_successfully(self, plugin_root):
         """Test that cc-plugins validates successfully."""
         result = subprocess.run(
@@ -259,11 +238,6 @@ class TestMetaPluginFunctionality:
 class TestProductionReadiness:
     """Test that plugin is production-ready."""
 
-    @pytest.fixture
-    def plugin_root(self):
-        """Get plugin root."""
-        return Path(__file__).parent.parent
-
     def test_plugin_has_complete_readme(self, plugin_root):
         """Test that plugin has complete README."""
         readme_path = plugin_root / "README.md"
@@ -319,13 +293,7 @@ class TestProductionReadiness:
 class TestSpecCompliance:
     """Test compliance with official specifications."""
 
-    @pytest.fixture
-    def manifest(self):
-        """Load manifest."""
-        manifest_path = Path(__file__).parent.parent / ".claude-plugin" / "plugin.json"
-        return json.loads(manifest_path.read_text())
-
-    def test_manifest_uses_official_fields(self, manifest):
+    def test_manifest_uses_official_fields(self, plugin_manifest):
         """Test that manifest uses official field names."""
         official_fields = {
             "name", "version", "description", "author", "homepage",
@@ -333,14 +301,14 @@ class TestSpecCompliance:
             "hooks", "mcpServers", "skills"
         }
         
-        for field in manifest:
+        for field in plugin_manifest:
             assert field in official_fields, \
                 f"Manifest uses unofficial field: {field}"
 
-    def test_author_field_structure(self, manifest):
+    def test_author_field_structure(self, plugin_manifest):
         """Test that author field follows spec."""
-        if "author" in manifest:
-            author = manifest["author"]
+        if "author" in plugin_manifest:
+            author = plugin_manifest["author"]
             assert isinstance(author, dict), "Author should be object"
 
 
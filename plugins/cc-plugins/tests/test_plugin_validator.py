@@ -328,6 +328,19 @@ class TestPluginValidatorExitCodes:
         # This test documents the expected behavior
         pass
 
+    def test_multiple_plugins_reported_as_json(self, validator_module, valid_plugin_structure,
+                                               temp_plugin_dir, capsys):
+        """Test that several plugins are validated in one run and reported as JSON."""
+        missing = temp_plugin_dir / "missing"
+        returncode = validator_module.main([str(valid_plugin_structure), str(missing)])
+
+        results = json.loads(capsys.readouterr().out)
+        assert [r["returncode"] for r in results] == [0, 1]
+        assert results[1]["path"] == str(missing.resolve())
+        assert "does not exist" in results[1]["errors"][0]
+        # The run fails if any plugin fails
+        assert returncode == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
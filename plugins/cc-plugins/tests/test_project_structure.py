@@ -10,13 +10,6 @@ Tests ensure that the plugin directory follows official Claude Code plugin speci
 import os
 import json
 import pytest
-from pathlib import Path
-
-
-@pytest.fixture
-def plugin_root():
-    """Returns the path to the cc-plugins plugin root directory."""
-    return Path(__file__).parent.parent
 
 
 @pytest.fixture